@@ -3,11 +3,14 @@ from __future__ import annotations
 import logging
 import os
 import secrets
+from typing import Mapping
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from itsdangerous import BadSignature, URLSafeSerializer
+from starlette.middleware.gzip import DEFAULT_EXCLUDED_CONTENT_TYPES
 
 from .middleware import RateLimitMiddleware
 from .route_inventory import (
@@ -26,14 +29,31 @@ from .routers.ops_write import router as ops_write_router
 from .routers.read import router as read_router
 from .routers.weekly_updates import router as weekly_updates_router
 from .routers.metrics import router as metrics_router
+from .services.files_write import invalidate_download_cache
+from .services.read import invalidate_read_cache
 from ai_actuarial.config import settings
 from ai_actuarial.shared_auth import hash_token
-from ai_actuarial.shared_runtime import get_sites_config_path, load_yaml, resolve_fastapi_env, resolve_runtime_features
+from ai_actuarial.shared_runtime import (
+    get_sites_config_path,
+    load_yaml_cached,
+    resolve_fastapi_env,
+    resolve_runtime_features,
+)
 from ai_actuarial.storage import Storage
 from ai_actuarial.task_runtime import NativeTaskRuntime
 
 logger = logging.getLogger(__name__)
 
+# Downloads are already-compressed documents (PDF, OOXML zips) or opaque
+# binaries; gzipping them only burns CPU and drops Content-Length.
+_GZIP_EXCLUDED_CONTENT_TYPES = DEFAULT_EXCLUDED_CONTENT_TYPES + (
+    "application/pdf",
+    "application/octet-stream",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+)
+
 CSRF_COOKIE_NAME = "csrf_token"
 CSRF_HEADER_NAME = "X-CSRF-Token"
 CSRF_SAFE_METHODS = {"GET", "HEAD", "OPTIONS", "TRACE"}
@@ -44,7 +64,7 @@ def _native_paths(app: FastAPI) -> list[str]:
 
 
 def _resolve_db_path() -> str:
-    config_data = load_yaml(get_sites_config_path(), default={})
+    config_data = load_yaml_cached(get_sites_config_path(), default={})
     return settings.resolve_db_path(config_data)
 
 
@@ -92,7 +112,7 @@ def _valid_csrf_token(request, token: str) -> bool:
     return isinstance(data, dict) and isinstance(data.get("nonce"), str) and bool(data.get("nonce"))
 
 
-def _default_session_cookie_secure(require_auth: bool, config_data: dict[str, object]) -> bool:
+def _default_session_cookie_secure(require_auth: bool, config_data: Mapping[str, object]) -> bool:
     fastapi_env, _source = resolve_fastapi_env(config_data)
     if not fastapi_env:
         fastapi_env = settings.FASTAPI_ENV
@@ -129,7 +149,7 @@ def _bootstrap_admin_token(db_path: str) -> None:
 
 
 def create_app() -> FastAPI:
-    config_data = load_yaml(get_sites_config_path(), default={})
+    config_data = load_yaml_cached(get_sites_config_path(), default={})
     runtime_features = resolve_runtime_features(config_data)
     app = FastAPI(
         title="AI Actuarial Info Search API",
@@ -257,6 +277,8 @@ def create_app() -> FastAPI:
         logger.exception("Failed to bootstrap admin auth token")
     _apply_runtime_feature_state(app, runtime_features)
     native_runtime = NativeTaskRuntime()
+    native_runtime.on_data_changed(invalidate_read_cache)
+    native_runtime.on_data_changed(invalidate_download_cache)
     native_refs = native_runtime.refs()
     app.state.native_task_runtime = native_runtime
     app.state.active_tasks_ref = native_refs.active_tasks_ref
@@ -301,16 +323,34 @@ def create_app() -> FastAPI:
 
     app.add_middleware(_MetricsMiddleware)
 
+    # Outermost, so JSON bodies (e.g. /api/files pages, task history) are
+    # compressed after every other middleware has run. Level 1 keeps most of
+    # the size win for a fraction of the CPU of the default level 9.
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=512,
+        compresslevel=1,
+        exclude_content_types=_GZIP_EXCLUDED_CONTENT_TYPES,
+    )
+
     return app
 
 
-def run_server(host: str = "127.0.0.1", port: int = 5000, reload: bool = False) -> None:
+def run_server(
+    host: str = "127.0.0.1",
+    port: int = 5000,
+    reload: bool = False,
+    workers: int = 1,
+) -> None:
     import uvicorn
 
+    # Each worker is a separate process with its own scheduler and task
+    # registry; ``reload`` always runs a single process.
     uvicorn.run(
         "ai_actuarial.api.app:create_app",
         factory=True,
         host=host,
         port=port,
         reload=reload,
+        workers=None if reload else max(1, workers),
     )
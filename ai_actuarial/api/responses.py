@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from email.utils import parsedate_to_datetime
+from typing import Any, Mapping
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered with orjson instead of ``json.dumps``.
+
+    Used as ``default_response_class`` by routers whose handlers return plain
+    dicts without a return annotation; annotated routes already serialize
+    through Pydantic's ``dump_json`` and should keep the default class so that
+    fast path stays enabled. Non-string dict keys are stringified like the
+    stdlib encoder does.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag.removeprefix("W/"):
+            return True
+    return False
+
+
+def is_not_modified(request_headers: Mapping[str, str], etag: str, last_modified: str | None = None) -> bool:
+    """Whether a GET can be answered with 304 given the representation's validators.
+
+    ``If-None-Match`` takes precedence; ``If-Modified-Since`` is only consulted
+    when it is absent (RFC 9110, section 13.2.2).
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request_headers.get("if-modified-since")
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
 
 from ..deps import AuthContext, require_permissions
+from ..responses import OrjsonResponse
 from ..services.agentic_rag import (
     AgenticRagError,
     chat_agentic_rag,
@@ -17,7 +17,7 @@ from ..services.agentic_rag import (
 )
 
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
 def _db_path(request: Request) -> str:
@@ -27,8 +27,8 @@ def _db_path(request: Request) -> str:
     return db_path
 
 
-def _error_response(exc: AgenticRagError) -> JSONResponse:
-    return JSONResponse(status_code=exc.status_code, content={"error": exc.message})
+def _error_response(exc: AgenticRagError) -> OrjsonResponse:
+    return OrjsonResponse(status_code=exc.status_code, content={"error": exc.message})
 
 
 @router.post("/agentic-rag/search/summaries")
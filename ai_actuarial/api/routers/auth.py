@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Body, Depends, Request, Response
-from fastapi.responses import JSONResponse
 
 from ..deps import AuthContext, get_auth_context, require_permissions
+from ..responses import OrjsonResponse
 from ..services.auth import (
     AuthApiError,
     _apply_session_mutation,
@@ -24,11 +24,11 @@ from ..services.auth import (
     user_me,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
-def _error_response(exc: AuthApiError) -> JSONResponse:
-    return JSONResponse(status_code=exc.status_code, content=exc.payload)
+def _error_response(exc: AuthApiError) -> OrjsonResponse:
+    return OrjsonResponse(status_code=exc.status_code, content=exc.payload)
 
 
 @router.get("/auth/me")
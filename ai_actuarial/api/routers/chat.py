@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Request, Response
-from fastapi.responses import JSONResponse
 
 from ..deps import AuthContext, require_permissions
+from ..responses import OrjsonResponse
 from ..services.chat import (
     ChatApiError,
     apply_session_update,
@@ -16,7 +16,7 @@ from ..services.chat import (
     query_chat,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
 def _db_path(request: Request) -> str:
@@ -26,8 +26,8 @@ def _db_path(request: Request) -> str:
     return db_path
 
 
-def _error_response(exc: ChatApiError) -> JSONResponse:
-    return JSONResponse(status_code=exc.status_code, content=exc.payload)
+def _error_response(exc: ChatApiError) -> OrjsonResponse:
+    return OrjsonResponse(status_code=exc.status_code, content=exc.payload)
 
 
 @router.get("/chat/conversations")
@@ -1,17 +1,20 @@
 from __future__ import annotations
 
+import mimetypes
 import os
-from urllib.parse import unquote
+from urllib.parse import quote, unquote
 
 from fastapi import APIRouter, Depends, Form, HTTPException, Request, UploadFile
-from fastapi.responses import FileResponse, JSONResponse, Response
+from fastapi.responses import FileResponse, Response
 
 from ai_actuarial.config import settings
 from ..deps import AuthContext, require_permissions
+from ..responses import OrjsonResponse, is_not_modified
 from ..services.import_batches import ImportBatchError, create_import_batch
 from ..services.files_write import (
     FileWriteError,
     delete_file_record,
+    download_offload_header,
     export_catalog,
     generate_file_chunk_sets,
     get_downloadable_file,
@@ -21,7 +24,7 @@ from ..services.files_write import (
     update_file_record,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
 def _db_path(request: Request) -> str:
@@ -31,6 +34,13 @@ def _db_path(request: Request) -> str:
     return db_path
 
 
+def _attachment_disposition(filename: str) -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
 def _extract_encoded_file_url(request: Request, *, suffix: str) -> str | None:
     raw_path = request.scope.get("raw_path")
     if not isinstance(raw_path, (bytes, bytearray)):
@@ -55,17 +65,17 @@ def _decode_file_url_path(request: Request, file_url: str, *, suffix: str) -> st
         return file_url
 
 
-def _json_error(exc: FileWriteError) -> JSONResponse:
-    return JSONResponse(status_code=exc.status_code, content={"error": exc.message})
+def _json_error(exc: FileWriteError) -> OrjsonResponse:
+    return OrjsonResponse(status_code=exc.status_code, content={"error": exc.message})
 
 
-def _require_config_write_token(request: Request) -> JSONResponse | None:
+def _require_config_write_token(request: Request) -> OrjsonResponse | None:
     expected_token = os.getenv("CONFIG_WRITE_AUTH_TOKEN") or settings.CONFIG_WRITE_AUTH_TOKEN
     if not expected_token:
         return None
     provided_token = request.headers.get("X-Auth-Token")
     if not provided_token or provided_token != expected_token:
-        return JSONResponse(status_code=403, content={"error": "Forbidden"})
+        return OrjsonResponse(status_code=403, content={"error": "Forbidden"})
     return None
 
 
@@ -78,9 +88,9 @@ async def api_files_import_batches(
 ):
     try:
         result = await create_import_batch(files=files, relative_paths=relative_paths, auth_token=auth.token)
-        return JSONResponse(status_code=201, content=result)
+        return OrjsonResponse(status_code=201, content=result)
     except ImportBatchError as exc:
-        return JSONResponse(status_code=exc.status_code, content={"error": exc.message})
+        return OrjsonResponse(status_code=exc.status_code, content={"error": exc.message})
 
 
 @router.post("/files/update")
@@ -128,8 +138,21 @@ def api_download(
 ):
     url = str(request.query_params.get("url", "") or "").strip()
     try:
-        path, filename = get_downloadable_file(db_path=_db_path(request), url=url)
-        return FileResponse(path=path, filename=filename)
+        path, filename, stat_result = get_downloadable_file(db_path=_db_path(request), url=url)
+        offload = download_offload_header(path)
+        if offload is None:
+            response = FileResponse(path=path, filename=filename, stat_result=stat_result)
+            validators = {key: response.headers[key] for key in ("etag", "last-modified")}
+            if is_not_modified(request.headers, validators["etag"], validators["last-modified"]):
+                return Response(status_code=304, headers=validators)
+            return response
+        # The proxy reads the file itself (sendfile), so no worker thread is
+        # held for the transfer.
+        header, value = offload
+        return Response(
+            media_type=mimetypes.guess_type(filename)[0] or "application/octet-stream",
+            headers={header: value, "Content-Disposition": _attachment_disposition(filename)},
+        )
     except FileWriteError as exc:
         return _json_error(exc)
 
@@ -186,6 +209,6 @@ def api_file_chunk_sets_generate(
     try:
         result = generate_file_chunk_sets(db_path=_db_path(request), file_url=decoded_url, payload=payload)
         status_code = 201 if not result.get("reused_existing") else 200
-        return JSONResponse(status_code=status_code, content=result)
+        return OrjsonResponse(status_code=status_code, content=result)
     except FileWriteError as exc:
         return _json_error(exc)
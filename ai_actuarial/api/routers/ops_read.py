@@ -3,17 +3,18 @@ from __future__ import annotations
 import os
 import time
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from ai_actuarial.ai_runtime import get_ai_routing, get_model_catalog, list_provider_credentials, list_provider_registry
 from ai_actuarial.config import settings
 from ai_actuarial.storage import Storage
 from ..deps import AuthContext, require_permissions
+from ..responses import OrjsonResponse, is_not_modified
 from ..services.ops_read import (
     get_ai_models,
     get_backend_settings,
     get_config_categories,
-    get_config_sites,
+    get_config_sites_body,
     get_global_logs,
     get_llm_providers,
     get_markdown_conversion_config,
@@ -50,7 +51,7 @@ def _global_logs_rate_key(request: Request, auth: AuthContext) -> str:
     return f"ip:{client_host}"
 
 
-def _enforce_global_logs_rate_limit(request: Request, auth: AuthContext) -> JSONResponse | None:
+def _enforce_global_logs_rate_limit(request: Request, auth: AuthContext) -> OrjsonResponse | None:
     now = time.monotonic()
     bucket_key = _global_logs_rate_key(request, auth)
     buckets = getattr(request.app.state, "global_logs_rate_limit_buckets", None)
@@ -59,29 +60,50 @@ def _enforce_global_logs_rate_limit(request: Request, auth: AuthContext) -> JSON
         request.app.state.global_logs_rate_limit_buckets = buckets
     recent = [stamp for stamp in buckets.get(bucket_key, []) if now - stamp < _GLOBAL_LOGS_WINDOW_SECONDS]
     if len(recent) >= _GLOBAL_LOGS_RATE_LIMIT:
-        return JSONResponse(status_code=429, content={"error": "Rate limit exceeded"})
+        return OrjsonResponse(status_code=429, content={"error": "Rate limit exceeded"})
     recent.append(now)
     buckets[bucket_key] = recent
     return None
 
 
+def _snapshot_etag(task_ref: object, variant: str = "") -> str | None:
+    # Read before the snapshot itself, so the validator never names a newer
+    # body than the one served with it. ``variant`` folds in the query
+    # parameters that shape the body, so one snapshot yields distinct tags.
+    etag = getattr(task_ref, "etag", None)
+    if not callable(etag):
+        return None
+    value = etag()
+    if variant and value.endswith('"'):
+        return f'{value[:-1]}-{variant}"'
+    return value
+
+
+def _task_list_response(payload: dict[str, object], etag: str | None) -> OrjsonResponse:
+    return OrjsonResponse(content=payload, headers={"ETag": etag} if etag else None)
+
+
 @router.get("/config/sites")
 def api_config_sites(
     request: Request,
     _auth: AuthContext = Depends(require_permissions("tasks.view")),
-) -> dict[str, object]:
+) -> Response:
     """
     List all configured sites (data sources) from sites.yaml.
 
     Returns:
         A dictionary with the full sites configuration, including names,
-        URLs, crawl rules, and schedule settings.
+        URLs, crawl rules, and schedule settings. The body carries an
+        ``ETag``; a matching ``If-None-Match`` gets an empty 304.
 
     Raises:
         401: If the request is not authenticated.
         403: If the caller lacks the ``tasks.view`` permission.
     """
-    return get_config_sites()
+    body, etag = get_config_sites_body()
+    if is_not_modified(request.headers, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/schedule/status")
@@ -104,28 +126,32 @@ def api_scheduled_tasks(
 def api_tasks_active(
     request: Request,
     _auth: AuthContext = Depends(require_permissions("tasks.view")),
-) -> dict[str, object]:
+) -> Response:
     """
     Return currently running tasks (in-progress collections/crawls).
 
     Returns:
         A dict with a ``tasks`` list containing the current state,
-        progress, and metadata for all active tasks.
+        progress, and metadata for all active tasks. The body carries an
+        ``ETag``; a matching ``If-None-Match`` gets an empty 304.
 
     Raises:
         401: If the request is not authenticated.
         403: If the caller lacks the ``tasks.view`` permission.
     """
     active_tasks_ref = getattr(request.app.state, "active_tasks_ref", {}) or {}
+    etag = _snapshot_etag(active_tasks_ref)
+    if etag and is_not_modified(request.headers, etag):
+        return Response(status_code=304, headers={"ETag": etag})
     task_lock = getattr(request.app.state, "task_lock", None)
-    return list_active_tasks(active_tasks_ref, task_lock)
+    return _task_list_response(list_active_tasks(active_tasks_ref, task_lock), etag)
 
 
 @router.get("/tasks/history")
 def api_tasks_history(
     request: Request,
     _auth: AuthContext = Depends(require_permissions("tasks.view")),
-) -> dict[str, object]:
+) -> Response:
     """
     Return historical (completed or failed) task records.
 
@@ -135,18 +161,29 @@ def api_tasks_history(
     Returns:
         A dict with a ``tasks`` list containing completed/failed
         task records with timestamps, status, and summary information.
+        The body carries an ``ETag``; a matching ``If-None-Match`` gets an
+        empty 304.
 
     Raises:
         401: If the request is not authenticated.
         403: If the caller lacks the ``tasks.view`` permission.
     """
     limit = parse_task_history_limit(request.query_params.get("limit"))
-    task_history_ref = getattr(request.app.state, "task_history_ref", []) or []
+    task_history_ref = getattr(request.app.state, "task_history_ref", None) or ()
+    etag = _snapshot_etag(task_history_ref, f"l{limit}")
+    if etag and is_not_modified(request.headers, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    published = getattr(task_history_ref, "snapshot", None)
+    if callable(published):
+        # Published tuple: no lock needed to read it.
+        return _task_list_response(list_task_history(published(), limit), etag)
     task_lock = getattr(request.app.state, "task_lock", None)
     if task_lock is None:
-        return list_task_history(task_history_ref, limit)
+        return _task_list_response(list_task_history(list(task_history_ref), limit), etag)
+    # Copy under the lock, then sort and serialize without holding it.
     with task_lock:
-        return list_task_history(task_history_ref, limit)
+        snapshot = list(task_history_ref)
+    return _task_list_response(list_task_history(snapshot, limit), etag)
 
 
 @router.get("/tasks/log/{task_id}")
@@ -159,7 +196,7 @@ def api_task_log(
     try:
         return get_task_log(task_id, tail)
     except ValueError as exc:
-        return JSONResponse(status_code=400, content={"error": str(exc)})
+        return OrjsonResponse(status_code=400, content={"error": str(exc)})
 
 
 @router.get("/logs/global")
@@ -174,10 +211,10 @@ def api_logs_global(
     if expected_token:
         provided_token = request.headers.get("X-Auth-Token")
         if not provided_token or provided_token != expected_token:
-            return JSONResponse(status_code=403, content={"error": "Forbidden"})
+            return OrjsonResponse(status_code=403, content={"error": "Forbidden"})
     result = get_global_logs(enabled=bool(getattr(request.app.state, "enable_global_logs_api", False)))
     if result.get("error") == "Forbidden":
-        return JSONResponse(status_code=403, content={"error": "Forbidden"})
+        return OrjsonResponse(status_code=403, content={"error": "Forbidden"})
     return result
 
 
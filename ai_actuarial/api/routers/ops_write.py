@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import Response
 
 from ..deps import AuthContext, require_permissions
+from ..responses import OrjsonResponse
 from ..services.ops_write import (
     BridgeState,
     OpsWriteError,
@@ -41,7 +42,7 @@ from ..services.ops_write import (
     validate_web_listening_rule,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
 def _bridge(request: Request) -> BridgeState:
@@ -55,8 +56,8 @@ def _db_path(request: Request) -> str:
     return db_path
 
 
-def _handle_ops_error(exc: OpsWriteError) -> JSONResponse:
-    return JSONResponse(status_code=exc.status_code, content={"error": exc.message})
+def _handle_ops_error(exc: OpsWriteError) -> OrjsonResponse:
+    return OrjsonResponse(status_code=exc.status_code, content={"error": exc.message})
 
 
 @router.post("/web-listening/rules/draft")
@@ -214,7 +215,7 @@ def api_config_backups_create(
     try:
         label = str(payload.get("label", "manual") or "manual")
         result = create_backup(label)
-        return JSONResponse(status_code=201, content=result)
+        return OrjsonResponse(status_code=201, content=result)
     except OpsWriteError as exc:
         return _handle_ops_error(exc)
 
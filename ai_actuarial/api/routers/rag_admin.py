@@ -4,11 +4,11 @@ import os
 import secrets
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
 
 from ai_actuarial.config import settings
 
 from ..deps import AuthContext, get_auth_context, require_permissions
+from ..responses import OrjsonResponse
 from ..services.rag_admin import (
     RagAdminError,
     add_knowledge_base_files,
@@ -39,7 +39,7 @@ from ..services.rag_admin import (
     update_knowledge_base,
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=OrjsonResponse)
 
 
 def _presented_token(request: Request) -> str | None:
@@ -98,8 +98,8 @@ def _bridge_state(request: Request):
     return request.app.state
 
 
-def _error_response(exc: RagAdminError) -> JSONResponse:
-    return JSONResponse(status_code=exc.status_code, content={"error": exc.message})
+def _error_response(exc: RagAdminError) -> OrjsonResponse:
+    return OrjsonResponse(status_code=exc.status_code, content={"error": exc.message})
 
 
 @router.get("/chunk/profiles")
@@ -121,7 +121,7 @@ def api_create_chunk_profile(
 ):
     try:
         result = create_chunk_profile(db_path=_db_path(request), payload=payload, headers=dict(request.headers), auth=_auth)
-        return JSONResponse(status_code=201, content=result)
+        return OrjsonResponse(status_code=201, content=result)
     except RagAdminError as exc:
         return _error_response(exc)
 
@@ -182,7 +182,7 @@ def api_create_knowledge_base(
 ):
     try:
         result = create_knowledge_base(db_path=_db_path(request), payload=payload, headers=dict(request.headers), auth=_auth)
-        return JSONResponse(status_code=201, content=result)
+        return OrjsonResponse(status_code=201, content=result)
     except RagAdminError as exc:
         return _error_response(exc)
 
@@ -428,6 +428,6 @@ def api_create_index_task(
             bridge_state=_bridge_state(request),
             auth=_auth,
         )
-        return JSONResponse(status_code=status_code, content=result)
+        return OrjsonResponse(status_code=status_code, content=result)
     except RagAdminError as exc:
         return _error_response(exc)
@@ -3,16 +3,19 @@ from __future__ import annotations
 from urllib.parse import unquote
 
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+
+from ai_actuarial.shared_runtime import coerce_bool
 
 from ..deps import AuthContext, require_permissions
+from ..responses import OrjsonResponse
 from ..services.read import (
     get_dashboard_stats,
     get_file_detail,
     get_file_markdown,
-    list_categories,
-    list_files,
-    list_sources,
+    list_categories_body,
+    list_files_body,
+    list_sources_body,
     parse_file_list_query,
 )
 
@@ -31,6 +34,10 @@ def _get_active_task_count(request: Request) -> int:
     if not isinstance(active_tasks_ref, dict):
         return 0
 
+    snapshot = getattr(active_tasks_ref, "snapshot", None)
+    if callable(snapshot):
+        return len(snapshot())
+
     task_lock = getattr(request.app.state, "task_lock", None)
     if task_lock is None:
         return len(active_tasks_ref)
@@ -67,6 +74,10 @@ def _decode_file_url_path(request: Request, file_url: str, *, suffix: str) -> st
         return file_url
 
 
+def _force_refresh(request: Request) -> bool:
+    return coerce_bool(request.query_params.get("force_refresh"), default=False)
+
+
 def _can_view_sensitive_file_fields(auth: AuthContext) -> bool:
     return bool(auth.token) and (
         "files.download" in auth.permissions
@@ -90,34 +101,37 @@ def api_stats(
 def api_sources(
     request: Request,
     _auth: AuthContext = Depends(require_permissions("files.read")),
-) -> dict[str, list[str]]:
-    return list_sources(db_path=_get_db_path(request))
+) -> Response:
+    body = list_sources_body(db_path=_get_db_path(request), force_refresh=_force_refresh(request))
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/categories")
 def api_categories(
     request: Request,
     _auth: AuthContext = Depends(require_permissions("files.read")),
-) -> dict[str, list[str]]:
+) -> Response:
     mode = str(request.query_params.get("mode", "") or "")
-    return list_categories(db_path=_get_db_path(request), mode=mode)
+    body = list_categories_body(db_path=_get_db_path(request), mode=mode, force_refresh=_force_refresh(request))
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/files")
 def api_files(
     request: Request,
     auth: AuthContext = Depends(require_permissions("files.read")),
-) -> dict[str, object]:
+) -> Response:
     query = parse_file_list_query(request.query_params)
     if query.include_deleted and "files.delete" not in auth.permissions:
         detail = "Unauthorized" if not auth.token else "Forbidden"
         status_code = 401 if not auth.token else 403
         raise HTTPException(status_code=status_code, detail=detail)
-    return list_files(
+    body = list_files_body(
         db_path=_get_db_path(request),
         query=query,
         include_sensitive=_can_view_sensitive_file_fields(auth),
     )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/files/detail")
@@ -127,7 +141,7 @@ def api_file_detail(
 ) -> dict[str, object]:
     url = str(request.query_params.get("url", "") or "").strip()
     if not url:
-        return JSONResponse(status_code=400, content={"error": "url parameter is required"})
+        return OrjsonResponse(status_code=400, content={"error": "url parameter is required"})
 
     file_data = get_file_detail(
         db_path=_get_db_path(request),
@@ -135,7 +149,7 @@ def api_file_detail(
         include_sensitive=_can_view_sensitive_file_fields(auth),
     )
     if not file_data:
-        return JSONResponse(status_code=404, content={"error": "File not found"})
+        return OrjsonResponse(status_code=404, content={"error": "File not found"})
 
     return {"file": file_data}
 
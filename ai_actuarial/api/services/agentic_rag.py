@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import sqlite3
 from pathlib import Path
 from typing import Any, Callable, Mapping
 
+import orjson
+
 from ai_actuarial.agentic_rag.agentic_loop import run_agentic_rag_loop
 from ai_actuarial.agentic_rag.ready_data_tools import (
     search_calculation_terms,
@@ -15,7 +16,7 @@ from ai_actuarial.agentic_rag.ready_data_tools import (
     search_titles,
     trace_relations,
 )
-from ai_actuarial.shared_runtime import parse_int_clamped
+from ai_actuarial.shared_runtime import agentic_ready_root, parse_int_clamped
 from ai_actuarial.storage import Storage
 
 
@@ -49,7 +50,7 @@ def _validate_ready_output_dir(output_dir: str) -> str:
 
 def _validate_agentic_ready_output_dir(*, db_path: str, output_dir: str) -> str:
     candidate = Path(_validate_ready_output_dir(output_dir)).resolve()
-    root = (Path(db_path).resolve().parent / "agentic_ready_data").resolve()
+    root = agentic_ready_root(db_path)
     try:
         candidate.relative_to(root)
     except ValueError as exc:
@@ -62,9 +63,8 @@ def _validate_agentic_ready_output_dir(*, db_path: str, output_dir: str) -> str:
 
 def _manifest_profile_from_output_dir(output_dir: str) -> str:
     try:
-        with (Path(output_dir) / "ready_data_manifest.json").open("r", encoding="utf-8") as f:
-            data = json.load(f)
-    except (OSError, json.JSONDecodeError):
+        data = orjson.loads((Path(output_dir) / "ready_data_manifest.json").read_bytes())
+    except (OSError, orjson.JSONDecodeError):
         return ""
     if not isinstance(data, dict):
         return ""
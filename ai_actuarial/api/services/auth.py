@@ -19,6 +19,7 @@ from ai_actuarial.shared_auth import (
     hash_password,
     hash_token,
 )
+from ai_actuarial.shared_runtime import parse_int_clamped
 from ai_actuarial.storage import Storage
 
 from ..deps import AuthContext, get_auth_context, public_permissions_for_request
@@ -451,14 +452,8 @@ def _serialize_user_row(storage: Storage, user: dict[str, Any]) -> dict[str, Any
 
 def list_users(*, request: Request) -> dict[str, Any]:
     query = request.query_params
-    try:
-        page = max(1, int(query.get("page", "1")))
-    except ValueError:
-        page = 1
-    try:
-        per_page = min(100, max(1, int(query.get("per_page", "50"))))
-    except ValueError:
-        per_page = 50
+    page = parse_int_clamped(query.get("page", "1"), default=1, min_value=1, max_value=10_000)
+    per_page = parse_int_clamped(query.get("per_page", "50"), default=50, min_value=1, max_value=100)
     role_filter = (query.get("role") or "").strip() or None
     search = (query.get("q") or "").strip() or None
 
@@ -534,19 +529,13 @@ def reset_user_quota(*, request: Request, auth: AuthContext, user_id: int, paylo
 
 
 def user_activity(*, request: Request, user_id: int) -> dict[str, Any]:
-    try:
-        limit = min(200, max(1, int(request.query_params.get("limit", "50"))))
-    except ValueError:
-        limit = 50
-    try:
-        offset = max(0, int(request.query_params.get("offset", "0")))
-    except ValueError:
-        offset = 0
+    limit = parse_int_clamped(request.query_params.get("limit", "50"), default=50, min_value=1, max_value=200)
+    offset = parse_int_clamped(request.query_params.get("offset", "0"), default=0, min_value=0, max_value=1_000_000)
 
     storage = Storage(_db_path(request))
     try:
         logs = storage.list_user_activity(user_id=user_id, limit=limit, offset=offset)
         normalized = _normalize_activity(logs)
-        return {"success": True, "logs": normalized, "activity": normalized}
+        return {"success": True, "logs": normalized, "activity": normalized, "limit": limit, "offset": offset}
     finally:
         storage.close()
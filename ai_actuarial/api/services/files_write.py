@@ -5,13 +5,22 @@ import hashlib
 import io
 import json
 import os
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
+from urllib.parse import quote
 
+from ai_actuarial.api.services.read import invalidate_read_cache
 from ai_actuarial.config import settings
 from ai_actuarial.rag.exceptions import ChunkingException
-from ai_actuarial.shared_runtime import get_sites_config_path, load_yaml, parse_int_clamped, resolve_runtime_features
-from ai_actuarial.storage import Storage
+from ai_actuarial.shared_runtime import (
+    get_sites_config_path,
+    load_yaml_cached,
+    parse_int_clamped,
+    resolve_runtime_features,
+)
+from ai_actuarial.storage import Storage, thread_read_storage
 
 
 class FileWriteError(Exception):
@@ -22,16 +31,37 @@ class FileWriteError(Exception):
 
 
 
-def _config_data() -> dict[str, Any]:
-    return load_yaml(get_sites_config_path(), default={})
+def _config_data() -> Mapping[str, Any]:
+    return load_yaml_cached(get_sites_config_path(), default={})
 
 
 
-def _download_dir() -> Path:
+def _download_dir_setting() -> tuple[str, str]:
     config = _config_data()
-    raw = str((config.get("paths") or {}).get("download_dir", "data/files"))
-    path = Path(raw)
-    return path.resolve() if path.is_absolute() else path.resolve()
+    return str((config.get("paths") or {}).get("download_dir", "data/files")), os.getcwd()
+
+
+def _download_dir() -> Path:
+    return _resolve_download_dir(*_download_dir_setting())
+
+
+def _download_dir_strs() -> tuple[str, str]:
+    """``(download_dir, data_root)`` as plain strings for the os.path download path."""
+    return _resolve_download_dir_strs(*_download_dir_setting())
+
+
+@lru_cache(maxsize=8)
+def _resolve_download_dir(raw: str, cwd: str) -> Path:
+    # realpath() walks every path component; the configured directory only
+    # changes with sites.yaml (or the working directory), so resolve it once.
+    # Its parent, the data root, is then already canonical as well.
+    return Path(cwd, raw).resolve()
+
+
+@lru_cache(maxsize=8)
+def _resolve_download_dir_strs(raw: str, cwd: str) -> tuple[str, str]:
+    download_dir = _resolve_download_dir(raw, cwd)
+    return str(download_dir), str(download_dir.parent)
 
 
 
@@ -50,6 +80,26 @@ def _resolve_local_path(local_path: str | None) -> Path | None:
     return fallback
 
 
+def _resolve_existing_local_path(local_path: str | None) -> str | None:
+    # Same candidates as _resolve_local_path, but realpath(strict=True) checks
+    # existence during the walk instead of stat'ing again afterwards. Plain
+    # os.path strings keep pathlib object construction off the download path.
+    raw = str(local_path or "").strip()
+    if not raw:
+        return None
+    if os.path.isabs(raw):
+        candidates: tuple[str, ...] = (raw,)
+    else:
+        download_dir, data_root = _download_dir_strs()
+        candidates = (os.path.join(data_root, raw), os.path.join(download_dir, raw))
+    for candidate in candidates:
+        try:
+            return os.path.realpath(candidate, strict=True)
+        except OSError:
+            continue
+    return None
+
+
 
 def _query_files_for_export(storage: Storage) -> list[dict[str, Any]]:
     rows, _total = storage.query_files_with_catalog(limit=100000, offset=0, include_deleted=True)
@@ -113,6 +163,9 @@ def update_file_record(*, db_path: str, payload: dict[str, Any]) -> dict[str, An
             if not success and reason != "no_updates":
                 raise FileWriteError("Update failed", status_code=500)
 
+        # Titles, summaries and keywords feed the /api/files search, so any
+        # edit can change a cached total, not just a category change.
+        invalidate_read_cache(db_path)
         file_data = storage.get_file_with_catalog(url)
         return {"success": True, "file": file_data}
     finally:
@@ -135,6 +188,7 @@ def update_file_markdown_content(*, db_path: str, url: str, payload: dict[str, A
             raise FileWriteError("File not found", status_code=404)
         if not success:
             raise FileWriteError("Update failed", status_code=500)
+        invalidate_read_cache(db_path)
         markdown = storage.get_file_markdown(url)
         return {"success": True, "markdown": markdown}
     finally:
@@ -142,33 +196,82 @@ def update_file_markdown_content(*, db_path: str, url: str, payload: dict[str, A
 
 
 
-def get_downloadable_file(*, db_path: str, url: str) -> tuple[Path, str]:
+DOWNLOAD_CACHE_TTL_SECONDS = 60.0
+_DOWNLOAD_CACHE_MAXSIZE = 1024
+
+# (db_path, url) -> (monotonic resolve time, (absolute path, download filename))
+_DOWNLOAD_CACHE: dict[tuple[str, str], tuple[float, tuple[str, str]]] = {}
+
+
+def invalidate_download_cache(db_path: str | None = None) -> None:
+    """Forget resolved ``/api/download`` paths for ``db_path``, or for every database."""
+    if db_path is None:
+        _DOWNLOAD_CACHE.clear()
+        return
+    for key in [key for key in _DOWNLOAD_CACHE if key[0] == db_path]:
+        _DOWNLOAD_CACHE.pop(key, None)
+
+
+def get_downloadable_file(*, db_path: str, url: str) -> tuple[str, str, os.stat_result]:
+    """Validated ``(absolute path, filename, stat)`` for ``url``.
+
+    Repeat downloads of a URL reuse the lookup for ``DOWNLOAD_CACHE_TTL_SECONDS``.
+    The single ``stat`` taken here both confirms that the file is still on
+    disk and feeds the response's size and validators.
+    """
     if not url:
         raise FileWriteError("URL parameter required")
-    storage = Storage(db_path)
+    key = (db_path, url)
+    now = time.monotonic()
+    hit = _DOWNLOAD_CACHE.get(key)
+    if hit is not None and now - hit[0] < DOWNLOAD_CACHE_TTL_SECONDS:
+        path, filename = hit[1]
+        try:
+            return path, filename, os.stat(path)
+        except OSError:
+            _DOWNLOAD_CACHE.pop(key, None)
+    path, filename = _resolve_downloadable_file(db_path, url)
     try:
-        file_record = storage.get_file_by_url(url)
-    finally:
-        storage.close()
+        stat_result = os.stat(path)
+    except OSError as exc:
+        raise FileWriteError("File not found on disk", status_code=404) from exc
+    if len(_DOWNLOAD_CACHE) >= _DOWNLOAD_CACHE_MAXSIZE:
+        _DOWNLOAD_CACHE.clear()
+    _DOWNLOAD_CACHE[key] = (now, (path, filename))
+    return path, filename, stat_result
+
+
+def _resolve_downloadable_file(db_path: str, url: str) -> tuple[str, str]:
+    file_record = thread_read_storage(db_path).get_file_by_url(url)
     if not file_record or not file_record.get("local_path"):
         raise FileWriteError("File not found", status_code=404)
 
-    resolved = _resolve_local_path(file_record.get("local_path"))
-    if resolved is None or not resolved.exists():
+    resolved = _resolve_existing_local_path(file_record.get("local_path"))
+    if resolved is None:
         raise FileWriteError("File not found on disk (path resolution failed)", status_code=404)
 
-    data_root = _download_dir().parent.resolve()
+    data_root = _download_dir_strs()[1]
     try:
-        is_within = os.path.commonpath([str(data_root), str(resolved)]) == str(data_root)
+        is_within = os.path.commonpath([data_root, resolved]) == data_root
     except ValueError:
         is_within = False
     if not is_within:
         raise FileWriteError("Forbidden", status_code=403)
 
-    filename = str(file_record.get("original_filename") or resolved.name or "download.bin")
+    filename = str(file_record.get("original_filename") or os.path.basename(resolved) or "download.bin")
     return resolved, filename
 
 
+def download_offload_header(path: str) -> tuple[str, str] | None:
+    """Return the reverse-proxy header that serves ``path``, if offload is configured."""
+    mode = settings.DOWNLOAD_OFFLOAD
+    if mode == "x-sendfile":
+        return "X-Sendfile", path
+    if mode == "x-accel-redirect":
+        relative = os.path.relpath(path, _download_dir_strs()[1]).replace(os.sep, "/")
+        return "X-Accel-Redirect", settings.DOWNLOAD_ACCEL_PREFIX.rstrip("/") + "/" + quote(relative)
+    return None
+
 
 def export_catalog(*, db_path: str, format_type: str) -> tuple[bytes, str, str]:
     storage = Storage(db_path)
@@ -217,11 +320,13 @@ def delete_file_record(*, db_path: str, payload: dict[str, Any], headers: dict[s
         deleted_time = __import__("datetime").datetime.now().isoformat()
         storage.mark_file_deleted(url, deleted_time)
         details["database_marked"] = True
+        invalidate_read_cache(db_path)
+        invalidate_download_cache(db_path)
         file_record = storage.get_file_by_url(url)
         if file_record and file_record.get("local_path"):
             candidate = _resolve_local_path(file_record.get("local_path"))
             if candidate is not None:
-                base_dir = _download_dir().parent.resolve()
+                base_dir = _download_dir().parent
                 try:
                     is_within = os.path.commonpath([str(base_dir), str(candidate)]) == str(base_dir)
                 except ValueError:
@@ -10,9 +10,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
 from fastapi import UploadFile
 
+from ai_actuarial.shared_runtime import load_yaml_cached
+
 ALLOWED_EXTENSIONS = {
     "csv",
     "doc",
@@ -45,10 +46,7 @@ class ImportBatchError(Exception):
 
 def _load_config_paths() -> dict[str, Any]:
     config_path = os.getenv("CONFIG_PATH") or "config/sites.yaml"
-    try:
-        data = yaml.safe_load(Path(config_path).read_text(encoding="utf-8")) or {}
-    except FileNotFoundError:
-        data = {}
+    data = load_yaml_cached(config_path, default={})
     return dict(data.get("paths") or {})
 
 
@@ -209,10 +207,10 @@ def load_import_batch(batch_id: str, *, auth_token: dict[str, Any] | None = None
     clean_id = str(batch_id or "").strip()
     if not clean_id or any(ch not in "0123456789abcdef" for ch in clean_id.lower()) or len(clean_id) != 32:
         raise ImportBatchError("Invalid upload batch")
-    path = _manifest_path(clean_id)
-    if not path.exists():
-        raise ImportBatchError("Upload batch not found", status_code=404)
-    manifest = json.loads(path.read_text(encoding="utf-8"))
+    try:
+        manifest = json.loads(_manifest_path(clean_id).read_text(encoding="utf-8"))
+    except FileNotFoundError as exc:
+        raise ImportBatchError("Upload batch not found", status_code=404) from exc
     if manifest.get("status") != "ready":
         raise ImportBatchError("Upload batch is not ready")
     if auth_token is not None and str(auth_token.get("group_name") or "").lower() != "admin":
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import heapq
 import os
 import re
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Mapping
 
+import orjson
 import ai_actuarial.llm_models as llm_models
 from ai_actuarial.ai_runtime import (
     KNOWN_LLM_PROVIDERS,
@@ -20,7 +23,7 @@ from ai_actuarial.shared_runtime import (
     coerce_bool,
     get_categories_config_path,
     get_sites_config_path,
-    load_yaml,
+    load_yaml_cached,
     parse_int_clamped,
     serialize_backend_settings,
     tail_text_file,
@@ -28,6 +31,8 @@ from ai_actuarial.shared_runtime import (
 )
 from ai_actuarial.storage import Storage
 
+_UNSAFE_TASK_ID_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
 _SEARCH_ENGINE_DISPLAY = {
     "brave": "Brave Search",
     "google": "Google (SerpAPI)",
@@ -35,9 +40,12 @@ _SEARCH_ENGINE_DISPLAY = {
     "tavily": "Tavily",
 }
 
+# (parsed sites.yaml document, serialized /api/config/sites body, ETag)
+_CONFIG_SITES_BODY: tuple[Mapping[str, Any], bytes, str] | None = None
+
 
 def get_config_categories() -> dict[str, object]:
-    config_data = load_yaml(
+    config_data = load_yaml_cached(
         get_categories_config_path(),
         default={"categories": {}, "ai_filter_keywords": [], "ai_keywords": []},
     )
@@ -54,7 +62,7 @@ def get_config_categories() -> dict[str, object]:
 
 
 def get_backend_settings() -> dict[str, Any]:
-    config_data = load_yaml(get_sites_config_path(), default={})
+    config_data = load_yaml_cached(get_sites_config_path(), default={})
     settings = serialize_backend_settings(config_data)
     runtime = settings.get("runtime")
     if isinstance(runtime, dict):
@@ -101,8 +109,28 @@ def get_markdown_conversion_config() -> dict[str, Any]:
 
 
 def get_config_sites() -> dict[str, object]:
-    config_path = get_sites_config_path()
-    current_config = load_yaml(config_path, default={})
+    return _build_config_sites(load_yaml_cached(get_sites_config_path(), default={}))
+
+
+def get_config_sites_body() -> tuple[bytes, str]:
+    """Return the serialized ``get_config_sites`` payload and its ETag.
+
+    The body is rebuilt only when ``load_yaml_cached`` hands back a new parsed
+    document, i.e. after sites.yaml changes on disk; repeat polls reuse the
+    same bytes.
+    """
+    global _CONFIG_SITES_BODY
+    current_config = load_yaml_cached(get_sites_config_path(), default={})
+    cached = _CONFIG_SITES_BODY
+    if cached is not None and cached[0] is current_config:
+        return cached[1], cached[2]
+    body = orjson.dumps(_build_config_sites(current_config), option=orjson.OPT_NON_STR_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    _CONFIG_SITES_BODY = (current_config, body, etag)
+    return body, etag
+
+
+def _build_config_sites(current_config: Mapping[str, Any]) -> dict[str, object]:
     sites = []
     site_defaults = current_config.get("defaults", {})
     for site in current_config.get("sites", []):
@@ -151,8 +179,7 @@ def get_schedule_status(schedule_ref: Any) -> dict[str, object]:
 
 
 def get_scheduled_tasks() -> dict[str, list[dict[str, Any]]]:
-    config_path = get_sites_config_path()
-    config_data = load_yaml(config_path, default={})
+    config_data = load_yaml_cached(get_sites_config_path(), default={})
     tasks = config_data.get("scheduled_tasks") or []
     return {"tasks": tasks if isinstance(tasks, list) else []}
 
@@ -222,6 +249,10 @@ def _serialize_task_for_api(task_data: dict[str, Any]) -> dict[str, Any]:
 
 
 def list_active_tasks(active_tasks_ref: dict[str, dict[str, Any]], task_lock: Any) -> dict[str, list[dict[str, Any]]]:
+    snapshot = getattr(active_tasks_ref, "snapshot", None)
+    if callable(snapshot):
+        # Published copies: serialize without contending with task writers.
+        return {"tasks": [_serialize_task_for_api(task) for task in snapshot()]}
     if task_lock is None:
         tasks = [_serialize_task_for_api(task) for task in active_tasks_ref.values()]
     else:
@@ -230,16 +261,16 @@ def list_active_tasks(active_tasks_ref: dict[str, dict[str, Any]], task_lock: An
     return {"tasks": tasks}
 
 
-def list_task_history(task_history_ref: list[dict[str, Any]], limit: int) -> dict[str, list[dict[str, Any]]]:
+def list_task_history(task_history_ref: Iterable[dict[str, Any]], limit: int) -> dict[str, list[dict[str, Any]]]:
     tasks = [
         _serialize_task_for_api(task)
-        for task in sorted(task_history_ref, key=lambda x: x.get("started_at", ""), reverse=True)[:limit]
+        for task in heapq.nlargest(limit, task_history_ref, key=lambda x: x.get("started_at", ""))
     ]
     return {"tasks": tasks}
 
 
 def get_task_log(task_id: str, tail: int) -> dict[str, Any]:
-    safe_id = re.sub(r"[^A-Za-z0-9_.-]+", "_", task_id or "")
+    safe_id = _UNSAFE_TASK_ID_RE.sub("_", task_id or "")
     if not safe_id:
         raise ValueError("Invalid task id")
     path = task_log_path(safe_id)
@@ -306,7 +337,7 @@ def get_ai_models(*, refresh: bool = False, storage: Storage | None = None) -> d
     provider_credentials = build_model_discovery_credentials(storage=storage)
     if refresh:
         llm_models.refresh_models(provider_credentials=provider_credentials)
-    config_data = load_yaml(get_sites_config_path(), default={})
+    config_data = load_yaml_cached(get_sites_config_path(), default={})
     ai_config = config_data.get("ai_config") or {}
     chatbot_cfg = ai_config.get("chatbot", {})
     chatbot_prompts = chatbot_cfg.get("prompts", {})
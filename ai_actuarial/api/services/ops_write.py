@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
+import secrets
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import yaml
 from cryptography.fernet import Fernet
@@ -33,11 +33,15 @@ from ai_actuarial.ai_runtime import (
     resolve_provider_credentials,
 )
 from ai_actuarial.shared_runtime import (
+    YAML_DUMPER,
+    YAML_LOADER,
+    append_job_history,
     append_task_log,
     get_categories_config_path,
     get_default_catalog_provider,
     get_sites_config_path,
     load_yaml,
+    load_yaml_cached,
     resolve_runtime_features,
     serialize_backend_settings,
 )
@@ -57,7 +61,7 @@ from ai_actuarial.web_listening_rule import (
 
 logger = logging.getLogger(__name__)
 
-_VALID_SCHEDULED_TASK_TYPES = [
+_VALID_SCHEDULED_TASK_TYPES = frozenset({
     "scheduled",
     "quick_check",
     "url",
@@ -69,7 +73,7 @@ _VALID_SCHEDULED_TASK_TYPES = [
     "weekly_summary",
     "rag_indexing",
     "kb_index_build",
-]
+})
 
 _VALID_INTERVALS = ["daily", "weekly", "daily at HH:MM", "every N hours", "every N minutes"]
 
@@ -80,7 +84,7 @@ _BINDING_MODEL_TYPE = {
     "ocr": "ocr",
 }
 
-_VALID_COLLECTION_TYPES = {
+_VALID_COLLECTION_TYPES = frozenset({
     "scheduled",
     "adhoc",
     "url",
@@ -94,7 +98,7 @@ _VALID_COLLECTION_TYPES = {
     "weekly_summary",
     "rag_indexing",
     "kb_index_build",
-}
+})
 
 
 def _is_valid_schedule_interval(interval: str) -> bool:
@@ -191,8 +195,12 @@ class OpsWriteError(Exception):
 class BridgeState:
     def __init__(self, app_state: Any) -> None:
         self.app_state = app_state
-        self.active_tasks_ref = getattr(app_state, "active_tasks_ref", {}) or {}
-        self.task_history_ref = getattr(app_state, "task_history_ref", []) or []
+        # Compare against None: an empty dict/deque is falsy, and replacing it
+        # would detach the bridge from the runtime's shared containers.
+        active_tasks_ref = getattr(app_state, "active_tasks_ref", None)
+        task_history_ref = getattr(app_state, "task_history_ref", None)
+        self.active_tasks_ref = {} if active_tasks_ref is None else active_tasks_ref
+        self.task_history_ref = [] if task_history_ref is None else task_history_ref
         self.task_lock = getattr(app_state, "task_lock", None)
         self.schedule_ref = getattr(app_state, "schedule_ref", None)
         self.start_background_task = getattr(app_state, "start_background_task", None)
@@ -207,7 +215,7 @@ def _load_config_data() -> dict[str, Any]:
 def _write_config_data(config_data: dict[str, Any]) -> None:
     config_path = get_sites_config_path()
     with open(config_path, "w", encoding="utf-8") as f:
-        yaml.dump(config_data, f, sort_keys=False, allow_unicode=True)
+        yaml.dump(config_data, f, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
 
 
 def _notify_site_config_updated(bridge: BridgeState | None, config_data: dict[str, Any]) -> None:
@@ -303,12 +311,26 @@ def _ensure_backup_dir() -> Path:
     return path
 
 
+def _iter_backup_entries(backups_dir: Path) -> Iterator[os.DirEntry[str]]:
+    # Plain prefix/suffix checks instead of glob's per-name fnmatch regex.
+    with os.scandir(backups_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("sites_") and entry.name.endswith(".yaml"):
+                yield entry
+
+
 def _should_auto_backup() -> bool:
-    backups_dir = _ensure_backup_dir()
-    backups = sorted(backups_dir.glob("sites_*.yaml"), key=lambda p: p.stat().st_mtime, reverse=True)
-    if not backups:
+    newest_mtime: float | None = None
+    for entry in _iter_backup_entries(_ensure_backup_dir()):
+        try:
+            mtime = entry.stat().st_mtime
+        except OSError:
+            continue
+        if newest_mtime is None or mtime > newest_mtime:
+            newest_mtime = mtime
+    if newest_mtime is None:
         return True
-    return (time.time() - backups[0].stat().st_mtime) > 300
+    return (time.time() - newest_mtime) > 300
 
 
 def _backup_config(label: str = "") -> str:
@@ -474,7 +496,7 @@ def import_sites(data: dict[str, Any], *, bridge: BridgeState | None = None) ->
 
     if yaml_text and not incoming_sites:
         try:
-            parsed = yaml.safe_load(yaml_text) or {}
+            parsed = yaml.load(yaml_text, Loader=YAML_LOADER) or {}
         except yaml.YAMLError as exc:
             raise OpsWriteError(f"Invalid YAML: {exc}") from exc
         if isinstance(parsed, dict):
@@ -660,7 +682,7 @@ def materialize_web_listening_rule(data: dict[str, Any], *, bridge: BridgeState
 def export_sites_yaml() -> tuple[str, str]:
     config_data = _load_config_data()
     sites_only = {"sites": config_data.get("sites", [])}
-    content = yaml.dump(sites_only, sort_keys=False, allow_unicode=True, default_flow_style=False)
+    content = yaml.dump(sites_only, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True, default_flow_style=False)
     filename = f"sites_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.yaml"
     return content, filename
 
@@ -670,18 +692,25 @@ def sample_sites_yaml() -> tuple[str, str]:
 
 
 def list_backups() -> dict[str, list[dict[str, Any]]]:
-    backups_dir = _ensure_backup_dir()
-    backups = []
-    for path in sorted(backups_dir.glob("sites_*.yaml"), key=lambda item: item.stat().st_mtime, reverse=True):
-        stat = path.stat()
-        backups.append(
-            {
-                "filename": path.name,
-                "timestamp": datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                "size_bytes": stat.st_size,
-                "size": stat.st_size,
-            }
-        )
+    # Stat each entry once and sort on the captured values; formatting only
+    # happens after ordering.
+    stats: list[tuple[float, int, str]] = []
+    for entry in _iter_backup_entries(_ensure_backup_dir()):
+        try:
+            stat = entry.stat()
+        except OSError:
+            continue
+        stats.append((stat.st_mtime, stat.st_size, entry.name))
+    stats.sort(key=lambda item: item[0], reverse=True)
+    backups = [
+        {
+            "filename": name,
+            "timestamp": datetime.fromtimestamp(mtime).isoformat(),
+            "size_bytes": size,
+            "size": size,
+        }
+        for mtime, size, name in stats
+    ]
     return {"backups": backups}
 
 
@@ -712,7 +741,7 @@ def restore_backup(filename: str, *, bridge: BridgeState | None = None) -> dict[
         raise OpsWriteError("Backup file not found", status_code=404)
 
     _backup_config("before_restore")
-    backup_data = yaml.safe_load(backup_path.read_text(encoding="utf-8")) or {}
+    backup_data = yaml.load(backup_path.read_text(encoding="utf-8"), Loader=YAML_LOADER) or {}
     config_data = _load_config_data()
     if "sites" in backup_data:
         config_data["sites"] = backup_data["sites"]
@@ -855,7 +884,7 @@ def update_categories_config(data: dict[str, Any]) -> dict[str, Any]:
     existing["ai_keywords"] = normalized_ai_keywords
     categories_path.parent.mkdir(parents=True, exist_ok=True)
     with open(categories_path, "w", encoding="utf-8") as handle:
-        yaml.dump(existing, handle, sort_keys=False, allow_unicode=True)
+        yaml.dump(existing, handle, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
     _reload_runtime_caches()
     return {
         "categories": normalized_categories,
@@ -1526,6 +1555,9 @@ def request_task_stop(task_id: str, *, bridge: BridgeState) -> dict[str, Any]:
             raise OpsWriteError("Task not found or not active", status_code=404)
         active_tasks[task_id]["stop_requested"] = True
         active_tasks[task_id]["current_activity"] = "Stop requested"
+        publish = getattr(active_tasks, "publish", None)
+        if callable(publish):
+            publish()
         return {"success": True, "message": "Stop signal sent"}
 
     with bridge.task_lock:
@@ -1533,18 +1565,14 @@ def request_task_stop(task_id: str, *, bridge: BridgeState) -> dict[str, Any]:
             raise OpsWriteError("Task not found or not active", status_code=404)
         bridge.active_tasks_ref[task_id]["stop_requested"] = True
         bridge.active_tasks_ref[task_id]["current_activity"] = "Stop requested"
+        publish = getattr(bridge.active_tasks_ref, "publish", None)
+        if callable(publish):
+            publish()
     return {"success": True, "message": "Stop signal sent"}
 
 
-def _append_history_to_disk(task_data: dict[str, Any]) -> None:
-    path = Path("data/job_history.jsonl")
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "a", encoding="utf-8") as f:
-        f.write(json.dumps(task_data, ensure_ascii=False) + "\n")
-
-
 def _record_rejected_task(reason: str, *, collection_type: str, data: dict[str, Any], bridge: BridgeState) -> None:
-    task_id = f"rejected_{int(datetime.now().timestamp())}"
+    task_id = f"rejected_{int(time.time() * 1000)}_{secrets.token_hex(2)}"
     task_name = str(data.get("name") or f"{collection_type} (rejected)")
     stamp = datetime.now().isoformat()
     log_file = str(Path("data/task_logs") / f"{task_id}.log")
@@ -1568,7 +1596,7 @@ def _record_rejected_task(reason: str, *, collection_type: str, data: dict[str,
     else:
         with bridge.task_lock:
             bridge.task_history_ref.append(task_data)
-    _append_history_to_disk(task_data)
+    append_job_history(task_data)
 
 
 def _reject_request(reason: str, *, collection_type: str, data: dict[str, Any], bridge: BridgeState) -> None:
@@ -1625,7 +1653,7 @@ def start_collection(data: dict[str, Any], *, bridge: BridgeState, auth_token: d
 
 
 def browse_folder(path: str | None = None) -> dict[str, Any]:
-    site_config = _load_config_data()
+    site_config = load_yaml_cached(get_sites_config_path(), default={})
     data_root = str((site_config.get("paths") or {}).get("download_dir", "data/files"))
     if not os.path.isabs(data_root):
         data_root = os.path.abspath(data_root)
@@ -1644,7 +1672,9 @@ def browse_folder(path: str | None = None) -> dict[str, Any]:
 
     entries = []
     try:
-        for entry in sorted(os.scandir(target), key=lambda item: item.name.lower()):
+        with os.scandir(target) as scanned:
+            listing = sorted(scanned, key=lambda item: item.name.lower())
+        for entry in listing:
             if entry.name.startswith("."):
                 continue
             if entry.is_dir(follow_symlinks=False):
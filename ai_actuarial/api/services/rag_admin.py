@@ -7,7 +7,7 @@ from typing import Any, Mapping
 from ai_actuarial.ai_runtime import build_embedding_fingerprint, infer_embedding_dimension, resolve_ai_function_runtime
 from ai_actuarial.agentic_rag.manifest_profiles import PROFILES
 from ai_actuarial.config import settings
-from ai_actuarial.shared_runtime import parse_int_clamped
+from ai_actuarial.shared_runtime import agentic_ready_root, parse_int_clamped
 from ai_actuarial.storage import Storage, _split_visible_categories
 
 
@@ -355,7 +355,7 @@ def _resolve_agentic_output_dir(
     profile_version: str,
     requested_output_dir: Any,
 ) -> str:
-    base_dir = (Path(db_path).resolve().parent / "agentic_ready_data").resolve()
+    base_dir = agentic_ready_root(db_path)
     safe_kb_id = "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in kb_id)
     requested = _norm(requested_output_dir)
     if requested:
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import os
+import time
 from dataclasses import dataclass
-from typing import Any, Mapping
+from functools import lru_cache
+from typing import Any, Callable, Iterator, Mapping
 
-from ai_actuarial.shared_runtime import get_categories_config_path, load_yaml, parse_int_clamped
-from ai_actuarial.storage import Storage
+import orjson
+
+from ai_actuarial.shared_runtime import get_categories_config_path, load_yaml_cached, parse_int_clamped
+from ai_actuarial.storage import Storage, thread_read_storage
 
 PUBLIC_FILE_LIST_FIELDS: tuple[str, ...] = (
     "url",
@@ -58,18 +62,27 @@ class FileListQuery:
     source: str
     category: str
     include_deleted: bool
+    include_total: bool = True
 
 
 def parse_file_list_query(raw_query: Mapping[str, str | None]) -> FileListQuery:
+    """Parse and normalize ``/api/files`` query args without touching the database."""
+    order_by = str(raw_query.get("order_by", "last_seen") or "last_seen")
+    if order_by not in Storage._QUERY_ORDER_COLUMN_MAP:
+        order_by = "last_seen"
+    order_dir = str(raw_query.get("order_dir", "desc") or "desc").lower()
+    if order_dir not in Storage._QUERY_ORDER_DIRECTIONS:
+        order_dir = "desc"
     return FileListQuery(
         limit=parse_int_clamped(raw_query.get("limit", 20), default=20, min_value=1, max_value=1000),
         offset=parse_int_clamped(raw_query.get("offset", 0), default=0, min_value=0, max_value=1_000_000),
-        order_by=str(raw_query.get("order_by", "last_seen") or "last_seen"),
-        order_dir=str(raw_query.get("order_dir", "desc") or "desc"),
+        order_by=order_by,
+        order_dir=order_dir,
         query=str(raw_query.get("query", "") or ""),
         source=str(raw_query.get("source", "") or ""),
         category=str(raw_query.get("category", "") or ""),
         include_deleted=str(raw_query.get("include_deleted", "false") or "false").lower() == "true",
+        include_total=str(raw_query.get("include_total", "true") or "true").lower() != "false",
     )
 
 
@@ -87,59 +100,129 @@ def project_database_files(files: list[dict[str, Any]], *, include_sensitive: bo
     return [_project_file_row(item, include_sensitive=include_sensitive) for item in files]
 
 
+STATS_CACHE_TTL_SECONDS = 5.0
+
+# db_path -> (monotonic read time, (total_files, cataloged_files, total_sources))
+_STATS_CACHE: dict[str, tuple[float, tuple[int, int, int]]] = {}
+
+
 def get_dashboard_stats(*, db_path: str, active_tasks: int) -> dict[str, int]:
-    storage = Storage(db_path)
-    try:
-        return {
-            "total_files": storage.get_file_count(require_local=True),
-            "cataloged_files": storage.get_cataloged_count(),
-            "total_sources": storage.get_sources_count(),
-            "active_tasks": active_tasks,
-        }
-    finally:
-        storage.close()
+    """Dashboard counters; the file counts are reused for ``STATS_CACHE_TTL_SECONDS``."""
+    now = time.monotonic()
+    hit = _STATS_CACHE.get(db_path)
+    if hit is not None and now - hit[0] < STATS_CACHE_TTL_SECONDS:
+        counts = hit[1]
+    else:
+        counts = thread_read_storage(db_path).get_dashboard_counts()
+        _STATS_CACHE[db_path] = (now, counts)
+    total_files, cataloged_files, total_sources = counts
+    return {
+        "total_files": total_files,
+        "cataloged_files": cataloged_files,
+        "total_sources": total_sources,
+        "active_tasks": active_tasks,
+    }
+
+
+READ_CACHE_TTL_SECONDS = 60.0
+
+# (endpoint, db_path, variant) -> (monotonic build time, serialized JSON body)
+_READ_CACHE: dict[tuple[str, str, str], tuple[float, bytes]] = {}
+
+
+FILE_COUNT_CACHE_TTL_SECONDS = 30.0
+_FILE_COUNT_CACHE_MAX_ENTRIES = 256
+
+# (db_path, query, source, category, include_deleted) -> (monotonic read time, total)
+_FILE_COUNT_CACHE: dict[tuple[str, str, str, str, bool], tuple[float, int]] = {}
+
+
+def invalidate_read_cache(db_path: str | None = None) -> None:
+    """Drop the cached ``/api/stats`` counts, ``/api/files`` totals and
+    ``/api/sources``/``/api/categories`` bodies.
+
+    With ``db_path`` only that database's entries go; otherwise all of them.
+    """
+    if db_path is None:
+        _READ_CACHE.clear()
+        _STATS_CACHE.clear()
+        _FILE_COUNT_CACHE.clear()
+        return
+    _STATS_CACHE.pop(db_path, None)
+    for key in [key for key in _READ_CACHE if key[1] == db_path]:
+        _READ_CACHE.pop(key, None)
+    for count_key in [count_key for count_key in _FILE_COUNT_CACHE if count_key[0] == db_path]:
+        _FILE_COUNT_CACHE.pop(count_key, None)
+
+
+def _cached_body(
+    key: tuple[str, str, str], build: Callable[[], dict[str, Any]], *, force_refresh: bool
+) -> bytes:
+    now = time.monotonic()
+    hit = _READ_CACHE.get(key)
+    if hit is not None and not force_refresh and now - hit[0] < READ_CACHE_TTL_SECONDS:
+        return hit[1]
+    body = orjson.dumps(build())
+    _READ_CACHE[key] = (now, body)
+    return body
+
+
+def list_categories_body(*, db_path: str, mode: str = "", force_refresh: bool = False) -> bytes:
+    """Serialized ``list_categories`` payload.
+
+    The configured list is cached per categories.yaml version; the list read
+    from the database is reused for ``READ_CACHE_TTL_SECONDS``.
+    """
+    if mode.strip().lower() != "used":
+        category_config_path = get_categories_config_path()
+        try:
+            stat = os.stat(category_config_path)
+        except OSError:
+            pass
+        else:
+            return _configured_categories_body(category_config_path, stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    return _cached_body(
+        ("categories", db_path, "used"),
+        lambda: list_categories(db_path=db_path, mode="used"),
+        force_refresh=force_refresh,
+    )
+
+
+@lru_cache(maxsize=4)
+def _configured_categories_body(path: str, mtime_ns: int, size: int, inode: int) -> bytes:
+    configured = load_yaml_cached(path, default={}).get("categories") or {}
+    return orjson.dumps({"categories": list(configured.keys()) if isinstance(configured, dict) else []})
+
+
+def list_sources_body(*, db_path: str, force_refresh: bool = False) -> bytes:
+    """Serialized ``list_sources`` payload, reused for ``READ_CACHE_TTL_SECONDS``."""
+    return _cached_body(("sources", db_path, ""), lambda: list_sources(db_path=db_path), force_refresh=force_refresh)
 
 
 def list_categories(*, db_path: str, mode: str = "") -> dict[str, list[str]]:
     if mode.strip().lower() == "used":
-        storage = Storage(db_path)
-        try:
-            categories = storage.get_unique_categories()
-        finally:
-            storage.close()
+        categories = thread_read_storage(db_path).get_unique_categories()
         return {"categories": categories}
 
     category_config_path = get_categories_config_path()
     if os.path.exists(category_config_path):
-        cat_config = load_yaml(category_config_path, default={})
+        cat_config = load_yaml_cached(category_config_path, default={})
         configured = cat_config.get("categories") or {}
         if isinstance(configured, dict):
             return {"categories": list(configured.keys())}
         return {"categories": []}
 
-    storage = Storage(db_path)
-    try:
-        categories = storage.get_unique_categories()
-    finally:
-        storage.close()
+    categories = thread_read_storage(db_path).get_unique_categories()
     return {"categories": categories}
 
 
 def list_sources(*, db_path: str) -> dict[str, list[str]]:
-    storage = Storage(db_path)
-    try:
-        sources = storage.get_unique_sources()
-    finally:
-        storage.close()
+    sources = thread_read_storage(db_path).get_unique_sources()
     return {"sources": sources}
 
 
 def get_file_detail(*, db_path: str, url: str, include_sensitive: bool = False) -> dict[str, Any] | None:
-    storage = Storage(db_path)
-    try:
-        file_data = storage.get_file_with_catalog(url)
-    finally:
-        storage.close()
+    file_data = thread_read_storage(db_path).get_file_with_catalog(url)
     if not file_data:
         return None
     if include_sensitive:
@@ -148,11 +231,7 @@ def get_file_detail(*, db_path: str, url: str, include_sensitive: bool = False)
 
 
 def get_file_markdown(*, db_path: str, url: str) -> dict[str, Any]:
-    storage = Storage(db_path)
-    try:
-        markdown_data = storage.get_file_markdown(url)
-    finally:
-        storage.close()
+    markdown_data = thread_read_storage(db_path).get_file_markdown(url)
 
     if markdown_data and markdown_data.get("markdown_content"):
         return {
@@ -167,24 +246,111 @@ def get_file_markdown(*, db_path: str, url: str) -> dict[str, Any]:
 
 
 def list_files(*, db_path: str, query: FileListQuery, include_sensitive: bool = False) -> dict[str, Any]:
-    storage = Storage(db_path)
-    try:
-        files, total = storage.query_files_with_catalog(
-            limit=query.limit,
-            offset=query.offset,
-            order_by=query.order_by,
-            order_dir=query.order_dir,
-            query=query.query,
-            source=query.source,
-            category=query.category,
-            include_deleted=query.include_deleted,
-        )
-    finally:
-        storage.close()
+    storage = thread_read_storage(db_path)
+    files: list[dict[str, Any]] = []
+    for batch in _iter_file_page(storage, query, include_sensitive=include_sensitive):
+        files.extend(batch)
+    total = _page_total(storage, query, len(files))
 
+    has_more = _page_has_more(files, query, total)
     return {
         "files": project_database_files(files, include_sensitive=include_sensitive),
         "total": total,
+        "has_more": has_more,
         "limit": query.limit,
         "offset": query.offset,
     }
+
+
+def list_files_body(*, db_path: str, query: FileListQuery, include_sensitive: bool = False) -> bytes:
+    """Serialized ``list_files`` payload, encoded one ``fetchmany`` batch at a time.
+
+    Rows are never held as a full page of dicts next to their encoded copy,
+    and the whole body is built before the response starts, so a database
+    error surfaces as an error response rather than truncated JSON. Reads go
+    through the thread's query-only connection, so nothing is left to close.
+    """
+    storage = thread_read_storage(db_path)
+    batches = _iter_file_page(storage, query, include_sensitive=include_sensitive)
+    return b"".join(_encode_file_list(storage, batches, query=query, include_sensitive=include_sensitive))
+
+
+def _page_total(storage: Storage, query: FileListQuery, page_len: int) -> int | None:
+    if not query.include_total:
+        return None
+    # A short page ends the result set, so the total follows from the page
+    # itself; only a full page, or an empty one past the start, needs COUNT(*).
+    if page_len < query.limit and (page_len or not query.offset):
+        return query.offset + page_len
+    # Paging through one filter repeats the same COUNT(*); reuse it for
+    # FILE_COUNT_CACHE_TTL_SECONDS.
+    key = (storage.db_path, query.query, query.source, query.category, query.include_deleted)
+    now = time.monotonic()
+    hit = _FILE_COUNT_CACHE.get(key)
+    if hit is not None and now - hit[0] < FILE_COUNT_CACHE_TTL_SECONDS:
+        return hit[1]
+    total = storage.count_files_with_catalog(
+        query=query.query,
+        source=query.source,
+        category=query.category,
+        include_deleted=query.include_deleted,
+    )
+    if len(_FILE_COUNT_CACHE) >= _FILE_COUNT_CACHE_MAX_ENTRIES:
+        _FILE_COUNT_CACHE.clear()
+    _FILE_COUNT_CACHE[key] = (now, total)
+    return total
+
+
+def _iter_file_page(
+    storage: Storage, query: FileListQuery, *, include_sensitive: bool
+) -> Iterator[list[dict[str, Any]]]:
+    # Without a total, one extra row is fetched so has_more can be answered
+    # without a COUNT(*) over the whole filter.
+    return storage.iter_files_with_catalog(
+        limit=query.limit if query.include_total else query.limit + 1,
+        offset=query.offset,
+        order_by=query.order_by,
+        order_dir=query.order_dir,
+        query=query.query,
+        source=query.source,
+        category=query.category,
+        include_deleted=query.include_deleted,
+        include_markdown_content=include_sensitive,
+    )
+
+
+def _page_has_more(files: list[dict[str, Any]], query: FileListQuery, total: int | None) -> bool:
+    if total is not None:
+        return query.offset + len(files) < total
+    if len(files) > query.limit:
+        del files[query.limit:]
+        return True
+    return False
+
+
+def _encode_file_list(
+    storage: Storage,
+    batches: Iterator[list[dict[str, Any]]],
+    *,
+    query: FileListQuery,
+    include_sensitive: bool,
+) -> Iterator[bytes]:
+    fields = FILE_LIST_FIELDS if include_sensitive else PUBLIC_FILE_LIST_FIELDS
+    separator = b""
+    emitted = 0
+    has_more = False
+    yield b'{"files":['
+    for batch in batches:
+        if emitted + len(batch) > query.limit:
+            batch = batch[: query.limit - emitted]
+            has_more = True
+        if batch:
+            chunk = b",".join(orjson.dumps({field: row.get(field) for field in fields}) for row in batch)
+            yield separator + chunk
+            separator = b","
+            emitted += len(batch)
+    total = _page_total(storage, query, emitted)
+    if total is not None:
+        has_more = query.offset + emitted < total
+    tail = {"total": total, "has_more": has_more, "limit": query.limit, "offset": query.offset}
+    yield b"]," + orjson.dumps(tail)[1:]
@@ -7,18 +7,21 @@ and ops_write.py for better code organization and reduced duplication.
 
 from __future__ import annotations
 
+import heapq
 import re
-from typing import Any
+from typing import Any, Iterable
 
 from ai_actuarial.shared_runtime import (
     get_sites_config_path,
-    load_yaml,
+    load_yaml_cached,
     parse_int_clamped,
     tail_text_file,
     task_log_path,
 )
 from ai_actuarial.storage import Storage
 
+_UNSAFE_TASK_ID_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
 
 # ---------------------------------------------------------------------------
 # Task query helpers (from ops_read.py)
@@ -90,6 +93,10 @@ def _serialize_task_for_api(task_data: dict[str, Any]) -> dict[str, Any]:
 
 
 def list_active_tasks(active_tasks_ref: dict[str, dict[str, Any]], task_lock: Any) -> dict[str, list[dict[str, Any]]]:
+    snapshot = getattr(active_tasks_ref, "snapshot", None)
+    if callable(snapshot):
+        # Published copies: serialize without contending with task writers.
+        return {"tasks": [_serialize_task_for_api(task) for task in snapshot()]}
     if task_lock is None:
         tasks = [_serialize_task_for_api(task) for task in active_tasks_ref.values()]
     else:
@@ -98,17 +105,17 @@ def list_active_tasks(active_tasks_ref: dict[str, dict[str, Any]], task_lock: An
     return {"tasks": tasks}
 
 
-def list_task_history(task_history_ref: list[dict[str, Any]], limit: int) -> dict[str, list[dict[str, Any]]]:
+def list_task_history(task_history_ref: Iterable[dict[str, Any]], limit: int) -> dict[str, list[dict[str, Any]]]:
     tasks = [
         _serialize_task_for_api(task)
-        for task in sorted(task_history_ref, key=lambda x: x.get("started_at", ""), reverse=True)[:limit]
+        for task in heapq.nlargest(limit, task_history_ref, key=lambda x: x.get("started_at", ""))
     ]
     return {"tasks": tasks}
 
 
 def get_task_log(task_id: str, tail: int) -> dict[str, Any]:
     """Read the log file for a task, returning the last `tail` lines."""
-    safe_id = re.sub(r"[^A-Za-z0-9_.-]+", "_", task_id or "")
+    safe_id = _UNSAFE_TASK_ID_RE.sub("_", task_id or "")
     if not safe_id:
         raise ValueError("Invalid task id")
     path = task_log_path(safe_id)
@@ -155,8 +162,7 @@ def get_schedule_status(schedule_ref: Any) -> dict[str, object]:
 
 
 def get_scheduled_tasks() -> dict[str, list[dict[str, Any]]]:
-    config_path = get_sites_config_path()
-    config_data = load_yaml(config_path, default={})
+    config_data = load_yaml_cached(get_sites_config_path(), default={})
     tasks = config_data.get("scheduled_tasks") or []
     return {"tasks": tasks if isinstance(tasks, list) else []}
 
@@ -381,9 +387,7 @@ def get_file_catalog_stats(db_path: str) -> dict[str, Any]:
     """Return file-level catalog statistics."""
     storage = Storage(db_path)
     try:
-        file_count = storage.get_file_count(require_local=True)
-        cataloged_count = storage.get_cataloged_count()
-        sources_count = storage.get_sources_count()
+        file_count, cataloged_count, sources_count = storage.get_dashboard_counts()
         unique_categories = storage.get_unique_categories()
         return {
             "file_count": file_count,
@@ -24,6 +24,7 @@ from .catalog import (
 from .catalog_incremental import run_incremental_catalog
 from .search import search_all
 from .ai_runtime import get_search_runtime_credentials
+from .shared_runtime import YAML_LOADER, parse_int_clamped
 from .storage import Storage
 from .collectors import CollectionConfig
 from .collectors.scheduled import ScheduledCollector
@@ -52,7 +53,7 @@ def _load_dotenv(path: str) -> None:
 
 def _load_config(path: str) -> dict:
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=YAML_LOADER)
 
 
 def _site_configs(cfg: dict) -> list[SiteConfig]:
@@ -60,13 +61,13 @@ def _site_configs(cfg: dict) -> list[SiteConfig]:
     defaults = cfg.get("defaults", {})
     
     # Pre-calculated merged defaults for efficiency
-    def_excl_kw = defaults.get("exclude_keywords", [])
-    def_excl_pfx = defaults.get("exclude_prefixes", [])
+    def_excl_kw = defaults.get("exclude_keywords") or []
+    def_excl_pfx = defaults.get("exclude_prefixes") or []
 
     for s in cfg.get("sites", []):
-        # Merge exclusions
-        excl_kw = list(set(def_excl_kw + s.get("exclude_keywords", [])))
-        excl_pfx = list(set(def_excl_pfx + s.get("exclude_prefixes", [])))
+        # Merge exclusions; dict.fromkeys dedupes while keeping config order
+        excl_kw = list(dict.fromkeys((*def_excl_kw, *(s.get("exclude_keywords") or []))))
+        excl_pfx = list(dict.fromkeys((*def_excl_pfx, *(s.get("exclude_prefixes") or []))))
 
         sites.append(
             SiteConfig(
@@ -434,6 +435,12 @@ def build_parser() -> argparse.ArgumentParser:
     p_api.add_argument("--host", default="127.0.0.1", help="Host to bind to")
     p_api.add_argument("--port", type=int, default=5000, help="Port to bind to")
     p_api.add_argument("--reload", action="store_true", help="Enable auto reload")
+    p_api.add_argument(
+        "--workers",
+        type=int,
+        default=parse_int_clamped(os.getenv("FASTAPI_WORKERS"), default=1, min_value=1, max_value=64),
+        help="Number of uvicorn worker processes (default: FASTAPI_WORKERS or 1)",
+    )
     p_api.set_defaults(func=cmd_api)
 
     return p
@@ -514,11 +521,11 @@ def cmd_api(args: argparse.Namespace) -> int:
         print("Install it with: pip install fastapi uvicorn")
         return 1
 
-    print(f"Starting FastAPI gateway on {args.host}:{args.port}")
+    print(f"Starting FastAPI gateway on {args.host}:{args.port} ({args.workers} worker(s))")
     logger.info("Press Ctrl+C to stop")
 
     try:
-        run_server(host=args.host, port=args.port, reload=args.reload)
+        run_server(host=args.host, port=args.port, reload=args.reload, workers=args.workers)
     except KeyboardInterrupt:
         print("\nShutting down...")
 
@@ -5,6 +5,9 @@ from __future__ import annotations
 import hashlib
 import logging
 import shutil
+import stat
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .base import BaseCollector, CollectionConfig, CollectionResult
@@ -15,20 +18,24 @@ logger = logging.getLogger(__name__)
 # Constants
 SHA256_CHUNK_SIZE = 128 * 1024  # 128KB chunks for hash calculation
 MAX_FILENAME_RETRIES = 1000  # Maximum attempts to find unique filename
+HASH_WORKERS = 4  # Files hashed concurrently ahead of the copy/insert loop
+HASH_WINDOW = HASH_WORKERS * 2  # Hash futures kept in flight at once
 
 
 class FileCollector(BaseCollector):
     """Collector for local file system imports."""
     
-    def __init__(self, storage: Storage, download_dir: str):
+    def __init__(self, storage: Storage, download_dir: str, stop_check=None):
         """Initialize file collector.
         
         Args:
             storage: Storage instance for database operations
             download_dir: Base directory for storing files
+            stop_check: Optional callable returning True once the import should stop
         """
         self.storage = storage
         self.download_dir = Path(download_dir)
+        self.stop_check = stop_check
     
     def collect(self, config: CollectionConfig, progress_callback=None) -> CollectionResult:
         """Execute file-based collection from local paths.
@@ -51,24 +58,30 @@ class FileCollector(BaseCollector):
             file_paths = config.metadata.get("file_paths", [])
             total_files = len(file_paths)
             target_subdir = config.metadata.get("target_subdir", "imported")
+            exclude_keywords = [k.lower() for k in config.exclude_keywords or []]
+            base_dir = self.download_dir.parent.resolve()
             
             if progress_callback:
                 progress_callback(0, total_files, "Starting file collection")
             
+            # Stat and name checks run first so only files that will be
+            # imported get hashed. Hashing then runs on a small pool ahead of
+            # the copy/insert loop, which stays serial: it shares one SQLite
+            # connection and dedupes each file against the ones before it.
+            candidates: list[tuple[int, str, Path]] = []
             for i, file_path in enumerate(file_paths):
-                if progress_callback:
-                    progress_callback(i, total_files, f"Processing: {Path(file_path).name}")
-                
                 try:
                     source_path = Path(file_path)
                     
-                    if not source_path.exists():
+                    try:
+                        source_stat = source_path.stat()
+                    except FileNotFoundError:
                         error_msg = f"File not found: {file_path}"
                         logger.error(error_msg)
                         errors.append(error_msg)
                         continue
                     
-                    if not source_path.is_file():
+                    if not stat.S_ISREG(source_stat.st_mode):
                         error_msg = f"Not a file: {file_path}"
                         logger.error(error_msg)
                         errors.append(error_msg)
@@ -76,66 +89,99 @@ class FileCollector(BaseCollector):
                     
                     items_found += 1
                     
-                    # Calculate SHA256
-                    sha256 = self._calculate_sha256(source_path)
-                    
-                    # Check if hash already exists in DB
-                    if self.storage.file_exists_by_hash(sha256):
-                        logger.info("Skipping already imported file (hash match): %s", file_path)
-                        items_skipped += 1
-                        continue
-
-                    # Check if should import
-                    if config.check_database and not self.should_download(str(source_path), sha256):
-                        logger.info("Skipping already imported file: %s", file_path)
-                        items_skipped += 1
-                        continue
-                    
-                    # Exclude check based on filename
-                    if config.exclude_keywords:
-                        if any(k.lower() in source_path.name.lower() for k in config.exclude_keywords):
+                    # Exclude check based on filename, before hashing the file
+                    if exclude_keywords:
+                        name_lower = source_path.name.lower()
+                        if any(k in name_lower for k in exclude_keywords):
                             logger.info("Skipping file (matched exclude keywords): %s", file_path)
                             items_skipped += 1
                             continue
-                            
-                    # Copy file to download directory
-                    target_dir = self.download_dir / target_subdir
-                    target_dir.mkdir(parents=True, exist_ok=True)
-                    
-                    # Handle filename conflicts
-                    target_path = self._get_unique_path(target_dir, source_path.name)
-                    shutil.copy2(source_path, target_path)
-                    
-                    # Add to database
-                    file_size = target_path.stat().st_size
-                    base_dir = self.download_dir.parent.resolve()
-                    target_resolved = target_path.resolve()
-                    try:
-                        rel_path = str(target_resolved.relative_to(base_dir))
-                    except ValueError:
-                        # Fallback to absolute path if relative path cannot be determined
-                        rel_path = str(target_resolved)
-                    
-                    self.storage.insert_file(
-                        url=f"file://{source_path}",
-                        sha256=sha256,
-                        title=source_path.stem,
-                        source_site="Local Import",  # Standardized name
-                        source_page_url=f"file://{source_path.parent}",
-                        original_filename=source_path.name,
-                        local_path=rel_path,
-                        bytes=file_size,
-                        content_type=self._guess_content_type(source_path.suffix),
-                    )
-                    
-                    items_downloaded += 1
-                    logger.info("Imported file: %s -> %s", source_path, target_path)
                     
+                    candidates.append((i, file_path, source_path))
                 except Exception as e:
                     error_msg = f"Error importing file {file_path}: {e}"
                     logger.error(error_msg)
                     errors.append(error_msg)
             
+            stopped = False
+            with ThreadPoolExecutor(max_workers=HASH_WORKERS, thread_name_prefix="file-hash") as hash_pool:
+                remaining = iter(candidates)
+                in_flight: deque = deque()
+
+                def submit_next() -> None:
+                    candidate = next(remaining, None)
+                    if candidate is not None:
+                        in_flight.append((candidate, hash_pool.submit(self._hash_or_error, candidate[2])))
+
+                for _ in range(HASH_WINDOW):
+                    submit_next()
+
+                while in_flight:
+                    if self.stop_check and self.stop_check():
+                        logger.info("File import stop requested; %d file(s) not processed", len(in_flight))
+                        stopped = True
+                        for _, pending in in_flight:
+                            pending.cancel()
+                        break
+                    (i, file_path, source_path), future = in_flight.popleft()
+                    submit_next()
+                    sha256, hash_error = future.result()
+                    if progress_callback:
+                        progress_callback(i, total_files, f"Processing: {source_path.name}")
+                    
+                    try:
+                        if hash_error is not None:
+                            raise hash_error
+                        
+                        # Check if hash already exists in DB
+                        if self.storage.file_exists_by_hash(sha256):
+                            logger.info("Skipping already imported file (hash match): %s", file_path)
+                            items_skipped += 1
+                            continue
+
+                        # Check if should import
+                        if config.check_database and not self.should_download(str(source_path), sha256):
+                            logger.info("Skipping already imported file: %s", file_path)
+                            items_skipped += 1
+                            continue
+                        
+                        # Copy file to download directory
+                        target_dir = self.download_dir / target_subdir
+                        target_dir.mkdir(parents=True, exist_ok=True)
+                        
+                        # Handle filename conflicts
+                        target_path = self._get_unique_path(target_dir, source_path.name)
+                        shutil.copy2(source_path, target_path)
+                        
+                        # Add to database
+                        file_size = target_path.stat().st_size
+                        target_resolved = target_path.resolve()
+                        try:
+                            rel_path = str(target_resolved.relative_to(base_dir))
+                        except ValueError:
+                            # Fallback to absolute path if relative path cannot be determined
+                            rel_path = str(target_resolved)
+                        
+                        self.storage.insert_file(
+                            url=f"file://{source_path}",
+                            sha256=sha256,
+                            title=source_path.stem,
+                            source_site="Local Import",  # Standardized name
+                            source_page_url=f"file://{source_path.parent}",
+                            original_filename=source_path.name,
+                            local_path=rel_path,
+                            bytes=file_size,
+                            content_type=self._guess_content_type(source_path.suffix),
+                        )
+                        
+                        items_downloaded += 1
+                        logger.info("Imported file: %s -> %s", source_path, target_path)
+                        
+                    except Exception as e:
+                        error_msg = f"Error importing file {file_path}: {e}"
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+            
             success = len(errors) == 0 or items_downloaded > 0
             
             return CollectionResult(
@@ -147,6 +193,7 @@ class FileCollector(BaseCollector):
                 metadata={
                     "source_type": "file",
                     "files_processed": len(file_paths),
+                    "stopped": stopped,
                 }
             )
             
@@ -185,6 +232,13 @@ class FileCollector(BaseCollector):
         
         return True
     
+    def _hash_or_error(self, file_path: Path) -> tuple[str | None, Exception | None]:
+        """Hash ``file_path`` on the pool, returning the error instead of raising it."""
+        try:
+            return self._calculate_sha256(file_path), None
+        except Exception as e:
+            return None, e
+    
     def _calculate_sha256(self, file_path: Path) -> str:
         """Calculate SHA256 hash of a file.
         
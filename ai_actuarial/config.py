@@ -15,7 +15,7 @@ from __future__ import annotations
 import os
 import warnings
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 __all__ = [
     "settings",
@@ -103,6 +103,14 @@ class Settings:
     FILE_DELETION_AUTH_TOKEN: str = os.getenv("FILE_DELETION_AUTH_TOKEN", "")
     ENABLE_FILE_DELETION: bool = _env_bool("ENABLE_FILE_DELETION", False)
 
+    # -------------------------------------------------------------------------
+    # Downloads
+    # -------------------------------------------------------------------------
+    # "x-accel-redirect" (nginx) or "x-sendfile" (Apache/lighttpd) lets the
+    # reverse proxy stream /api/download bodies; empty serves them from Python.
+    DOWNLOAD_OFFLOAD: str = os.getenv("DOWNLOAD_OFFLOAD", "").strip().lower()
+    DOWNLOAD_ACCEL_PREFIX: str = _env_str("DOWNLOAD_ACCEL_PREFIX", "/protected-files/")
+
     # -------------------------------------------------------------------------
     # Feature Flags
     # -------------------------------------------------------------------------
@@ -146,7 +154,7 @@ class Settings:
         return bool(mapping.get(engine_id, "").strip())
 
     @classmethod
-    def resolve_db_path(cls, config_data: dict[str, Any] | None = None) -> str:
+    def resolve_db_path(cls, config_data: Mapping[str, Any] | None = None) -> str:
         """Resolve the database path from config or environment defaults."""
         if config_data:
             paths_cfg = config_data.get("paths") if isinstance(config_data.get("paths"), dict) else {}
@@ -17,6 +17,8 @@ from typing import Any, Mapping
 
 import yaml
 
+from ai_actuarial.shared_runtime import YAML_DUMPER, YAML_LOADER
+
 ENGINE_PROVIDERS: dict[str, str] = {
     "auto": "auto",
     "opendataloader": "local",
@@ -192,7 +194,7 @@ def _read_yaml(path: str) -> dict[str, Any]:
     if not path or not Path(path).exists():
         return {}
     with open(path, "r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = yaml.load(handle, Loader=YAML_LOADER) or {}
     return data if isinstance(data, dict) else {}
 
 
@@ -315,7 +317,7 @@ def write_markdown_conversion_config(config: Mapping[str, Any], path: str | None
     fd, temp_name = tempfile.mkstemp(prefix=f".{target.name}.", suffix=".tmp", dir=str(target.parent))
     try:
         with os.fdopen(fd, "w", encoding="utf-8") as handle:
-            yaml.safe_dump(normalized, handle, sort_keys=False, allow_unicode=True)
+            yaml.dump(normalized, handle, Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
             handle.flush()
             os.fsync(handle.fileno())
         os.replace(temp_name, target)
@@ -1,12 +1,25 @@
 from __future__ import annotations
 
+import logging
 import os
-from collections import deque
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
+import orjson
 import yaml
 
+logger = logging.getLogger(__name__)
+
+# libyaml's C loader/dumper when PyYAML was built with it; same safe semantics.
+# Every YAML read/write in the package goes through these two.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YAML_CACHE: dict[str, tuple[tuple[int, int, int], Mapping[str, Any]]] = {}
+_YAML_CACHE_LOCK = threading.Lock()
+
 
 def env_flag(name: str, default: bool = False) -> bool:
     raw = os.getenv(name)
@@ -61,7 +74,7 @@ def _feature_bool(
     return default, "default"
 
 
-def resolve_runtime_features(config_data: dict[str, Any]) -> dict[str, Any]:
+def resolve_runtime_features(config_data: Mapping[str, Any]) -> dict[str, Any]:
     """Resolve non-secret runtime feature switches from sites.yaml with env overrides."""
     raw_features = config_data.get("features") or {}
     features = raw_features if isinstance(raw_features, dict) else {}
@@ -119,7 +132,7 @@ def resolve_runtime_features(config_data: dict[str, Any]) -> dict[str, Any]:
     return resolved
 
 
-def resolve_fastapi_env(config_data: dict[str, Any]) -> tuple[str, str]:
+def resolve_fastapi_env(config_data: Mapping[str, Any]) -> tuple[str, str]:
     """Resolve FastAPI environment from env override, then sites.yaml server config."""
     raw_env = os.getenv("FASTAPI_ENV")
     if raw_env is not None and raw_env.strip():
@@ -165,10 +178,40 @@ def load_yaml(path: str, default: dict[str, Any] | None = None) -> dict[str, Any
     if not path or not os.path.exists(path):
         return fallback
     with open(path, "r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = yaml.load(handle, Loader=YAML_LOADER) or {}
     return data if isinstance(data, dict) else fallback
 
 
+def load_yaml_cached(path: str, default: dict[str, Any] | None = None) -> Mapping[str, Any]:
+    """Like ``load_yaml`` but reuses the parsed document until the file changes.
+
+    The cache is keyed on the file's mtime, size and inode from one ``stat``,
+    so edits made through the config endpoints (or by hand, including atomic
+    rename-over saves) are picked up on the next call. The parsed document is
+    shared between callers, so it is returned as a read-only
+    ``MappingProxyType``; nested values must not be mutated either.
+    """
+    fallback = default.copy() if isinstance(default, dict) else {}
+    if not path:
+        return fallback
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return fallback
+    signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    cached = _YAML_CACHE.get(path)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    with open(path, "r", encoding="utf-8") as handle:
+        data = yaml.load(handle, Loader=YAML_LOADER) or {}
+    if not isinstance(data, dict):
+        return fallback
+    frozen = MappingProxyType(data)
+    with _YAML_CACHE_LOCK:
+        _YAML_CACHE[path] = (signature, frozen)
+    return frozen
+
+
 def get_default_catalog_provider() -> str:
     config = load_yaml(get_sites_config_path(), default={})
     ai_cfg = config.get("ai_config") or {}
@@ -181,10 +224,80 @@ def get_default_catalog_provider() -> str:
     return provider or "openai"
 
 
+def agentic_ready_root(db_path: str) -> Path:
+    """Resolved ``agentic_ready_data`` directory that sits next to ``db_path``."""
+    return _resolve_agentic_ready_root(db_path, os.getcwd())
+
+
+@lru_cache(maxsize=8)
+def _resolve_agentic_ready_root(db_path: str, cwd: str) -> Path:
+    # The database path is fixed for the life of the app, so resolve the
+    # ready-data root once instead of realpath()'ing it on every request.
+    return (Path(cwd, db_path).resolve().parent / "agentic_ready_data").resolve()
+
+
 def task_log_path(task_id: str) -> Path:
     return Path("data/task_logs") / f"{task_id}.log"
 
 
+JOB_HISTORY_PATH = Path("data/job_history.jsonl")
+
+
+def append_job_history(task_data: Mapping[str, Any]) -> None:
+    """Append one finished task to ``JOB_HISTORY_PATH`` as a JSON line.
+
+    The line goes out as a single ``write`` on an ``O_APPEND`` descriptor, so
+    concurrent finishers never interleave partial records.
+    """
+    line = orjson.dumps(task_data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    JOB_HISTORY_PATH.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(JOB_HISTORY_PATH, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+# Past this size job_history.jsonl is moved to job_history.jsonl.1 when loaded.
+JOB_HISTORY_ROTATE_BYTES = 10 * 1024 * 1024
+_JOB_HISTORY_TAIL_BLOCK = 64 * 1024
+
+
+def load_job_history_tail(limit: int) -> list[dict[str, Any]]:
+    """Return the last ``limit`` records of ``JOB_HISTORY_PATH``, oldest first.
+
+    Only the end of the file is read, in blocks doubling from 64 KiB, so the
+    cost does not grow with the file. A file over ``JOB_HISTORY_ROTATE_BYTES``
+    is rotated afterwards, replacing any previous ``.1`` file.
+    """
+    try:
+        handle = JOB_HISTORY_PATH.open("rb")
+    except FileNotFoundError:
+        return []
+    with handle:
+        end = os.fstat(handle.fileno()).st_size
+        start, block = end, _JOB_HISTORY_TAIL_BLOCK
+        lines: list[bytes] = []
+        while start > 0 and len(lines) < limit:
+            start = max(0, start - block)
+            block *= 2
+            handle.seek(start)
+            lines = handle.read(end - start).split(b"\n")
+            if start > 0:
+                # The seek landed inside a record.
+                lines = lines[1:]
+            lines = [line for line in lines if line.strip()]
+    rows: list[dict[str, Any]] = []
+    for line in lines[-limit:]:
+        try:
+            rows.append(orjson.loads(line))
+        except orjson.JSONDecodeError as exc:
+            logger.warning("Skipping malformed job history line in %s: %s", JOB_HISTORY_PATH, exc)
+    if end > JOB_HISTORY_ROTATE_BYTES:
+        os.replace(JOB_HISTORY_PATH, JOB_HISTORY_PATH.with_name(JOB_HISTORY_PATH.name + ".1"))
+    return rows
+
+
 def append_task_log(task_id: str, level: str, message: str) -> None:
     path = task_log_path(task_id)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -192,15 +305,38 @@ def append_task_log(task_id: str, level: str, message: str) -> None:
         handle.write(f"[{level}] {message}\n")
 
 
-def tail_text_file(path: Path, max_lines: int = 400) -> str:
-    if max_lines <= 0 or not path.exists():
-        return ""
-    with path.open("r", encoding="utf-8", errors="replace") as handle:
-        lines = deque(handle, maxlen=max_lines)
-    return "".join(lines)
+_TAIL_TEXT_BLOCK = 8 * 1024
+
 
+def tail_text_file(path: Path, max_lines: int = 400) -> str:
+    """Return the last ``max_lines`` lines of ``path`` with ``\n`` line endings.
 
-def serialize_backend_settings(config_data: dict[str, Any]) -> dict[str, Any]:
+    The file is read backward from its end in doubling blocks, so the cost
+    follows the size of the tail rather than of the whole log.
+    """
+    if max_lines <= 0:
+        return ""
+    try:
+        handle = path.open("rb")
+    except FileNotFoundError:
+        return ""
+    with handle:
+        end = os.fstat(handle.fileno()).st_size
+        start, block, data = end, _TAIL_TEXT_BLOCK, b""
+        while start > 0 and data.count(b"\n") <= max_lines:
+            start = max(0, start - block)
+            block *= 2
+            handle.seek(start)
+            data = handle.read(end - start)
+    lines = data.splitlines(keepends=True)
+    if start > 0:
+        # The seek landed inside a line.
+        lines = lines[1:]
+    text = b"".join(lines[-max_lines:]).decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def serialize_backend_settings(config_data: Mapping[str, Any]) -> dict[str, Any]:
     defaults = config_data.get("defaults") or {}
     paths = config_data.get("paths") or {}
     search = config_data.get("search") or {}
@@ -3,15 +3,28 @@ from __future__ import annotations
 import json
 import os
 import sqlite3
+import threading
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Iterable
+from typing import Any, Iterable, Iterator
 import hashlib
 
+import orjson
+
 from ai_actuarial.ai_runtime import infer_embedding_dimension, infer_embedding_provider
 
+# Database files whose schema this process has already brought up to date,
+# keyed by (st_dev, st_ino) and mapped to (PRAGMA schema_version, FTS enabled).
+# The schema_version check catches a recreated file that reused the inode and
+# any schema change made by another process; either way setup simply reruns.
+_SCHEMA_READY: dict[tuple[int, int], tuple[int, bool]] = {}
+
+# Per-thread read-only Storage handles for request handlers, keyed by db_path
+# and mapped to (schema key at open time, Storage); see ``thread_read_storage``.
+_READ_STORAGE = threading.local()
 
 def _is_internal_category_label(category: str) -> bool:
     value = str(category or "").strip()
@@ -29,6 +42,15 @@ def _split_visible_categories(raw_category: str | None) -> list[str]:
     ]
 
 
+def _file_row_to_dict(keys: tuple[str, ...], row: tuple[Any, ...]) -> dict[str, Any]:
+    """Map a files + catalog_items row onto ``keys``, decoding ``keywords``."""
+    item = dict(zip(keys, row))
+    keywords = item["keywords"]
+    item["keywords"] = orjson.loads(keywords) if keywords else []
+    item["rag_chunk_count"] = item["rag_chunk_count"] or 0
+    return item
+
+
 class Storage:
     # Allowlist for schema/migration helpers that interpolate table names into PRAGMA.
     _SCHEMA_TABLES = frozenset(
@@ -56,14 +78,44 @@ class Storage:
         }
     )
 
+    _LISTED_FILE_INDEX_COLUMNS: tuple[str, ...] = (
+        "last_seen",
+        "first_seen",
+        "crawl_time",
+        "title",
+        "source_site",
+        "bytes",
+    )
+
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
         Path(os.path.dirname(db_path)).mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(db_path)
+        self._conn = sqlite3.connect(db_path, cached_statements=256)
         self._conn.execute("PRAGMA foreign_keys=ON;")
         self._conn.execute("PRAGMA journal_mode=WAL;")
         self._tx_depth = 0
-        self._init_schema()
+        # Schema setup is idempotent but runs well over a hundred statements;
+        # request handlers open a Storage per call, so skip it once done.
+        schema_key = self._schema_key()
+        ready = _SCHEMA_READY.get(schema_key) if schema_key else None
+        if ready is not None and ready[0] == self._schema_version():
+            self._fts_enabled = ready[1]
+        else:
+            self._init_schema()
+            if schema_key:
+                _SCHEMA_READY[schema_key] = (self._schema_version(), self._fts_enabled)
+
+    def _schema_key(self) -> tuple[int, int] | None:
+        if self.db_path == ":memory:" or self.db_path.startswith("file:"):
+            return None
+        try:
+            stat = os.stat(self.db_path)
+        except OSError:
+            return None
+        return stat.st_dev, stat.st_ino
+
+    def _schema_version(self) -> int:
+        return int(self._conn.execute("PRAGMA schema_version").fetchone()[0])
 
     def _init_schema(self) -> None:
         self._conn.execute(
@@ -93,6 +145,22 @@ class Storage:
             self._conn.execute("SELECT deleted_at FROM files LIMIT 1")
         except sqlite3.OperationalError:
              self._conn.execute("ALTER TABLE files ADD COLUMN deleted_at TEXT")
+        self._fts_enabled = self._ensure_files_fts()
+        # Partial indexes matching the default file-list filter, so that
+        # ORDER BY <column> LIMIT n walks an index instead of sorting every
+        # listed file. id and url are already covered by rowid / UNIQUE.
+        for column in self._LISTED_FILE_INDEX_COLUMNS:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_files_listed_{column} ON files({column}) "
+                "WHERE local_path IS NOT NULL AND local_path != '' AND deleted_at IS NULL"
+            )
+        # Weekly update summaries range-scan first_seen over all live files,
+        # including those without a local copy. The first_seen predicate keeps
+        # this index out of the plain file-list ORDER BY first_seen plans.
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_files_live_first_seen ON files(first_seen) "
+            "WHERE deleted_at IS NULL AND first_seen IS NOT NULL"
+        )
 
         self._conn.execute(
             """
@@ -137,6 +205,10 @@ class Storage:
             CREATE INDEX IF NOT EXISTS idx_catalog_items_status ON catalog_items(status)
             """
         )
+        # file_url is the primary key, which already serves the per-file
+        # category probe; drop the redundant (file_url, category) index that
+        # older databases carry.
+        self._conn.execute("DROP INDEX IF EXISTS idx_catalog_items_file_url_category")
 
         # auth_tokens: token-based authentication for public deployments
         self._conn.execute(
@@ -670,6 +742,58 @@ class Storage:
         if changed:
             self._conn.commit()
 
+    def _ensure_files_fts(self) -> bool:
+        """Create the trigram FTS5 index over file title/filename/url.
+
+        files_fts is a regular FTS5 table keyed by files.id (not external
+        content) so that a stale row left behind by ``INSERT OR REPLACE INTO
+        files`` cannot corrupt the index; it simply stops joining to a file.
+        Returns False when this SQLite build lacks FTS5/trigram support, in
+        which case searches keep using LIKE.
+        """
+        created = not self._table_exists("files_fts")
+        try:
+            self._conn.execute(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS files_fts
+                USING fts5(title, original_filename, url, tokenize='trigram')
+                """
+            )
+        except sqlite3.OperationalError:
+            return False
+        self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS files_fts_after_insert AFTER INSERT ON files BEGIN
+                INSERT OR REPLACE INTO files_fts(rowid, title, original_filename, url)
+                VALUES (new.id, new.title, new.original_filename, new.url);
+            END
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS files_fts_after_update
+            AFTER UPDATE OF title, original_filename, url ON files BEGIN
+                INSERT OR REPLACE INTO files_fts(rowid, title, original_filename, url)
+                VALUES (new.id, new.title, new.original_filename, new.url);
+            END
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TRIGGER IF NOT EXISTS files_fts_after_delete AFTER DELETE ON files BEGIN
+                DELETE FROM files_fts WHERE rowid = old.id;
+            END
+            """
+        )
+        if created:
+            self._conn.execute(
+                """
+                INSERT INTO files_fts(rowid, title, original_filename, url)
+                SELECT id, title, original_filename, url FROM files
+                """
+            )
+        return True
+
     def _table_exists(self, table: str) -> bool:
         row = self._conn.execute(
             "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ? LIMIT 1",
@@ -1242,6 +1366,32 @@ class Storage:
         'last_seen': 'f.last_seen',
         'crawl_time': 'f.crawl_time',
     }
+    _QUERY_ORDER_DIRECTIONS = {'asc': 'ASC', 'desc': 'DESC'}
+
+    _FILE_LIST_CATALOG_COLUMNS_SQL = """,
+                   c.category, c.summary, c.keywords,
+                   c.markdown_content, c.markdown_source, c.markdown_updated_at,
+                   c.rag_chunk_count, c.rag_indexed_at"""
+    _EMPTY_FILE_LIST_CATALOG_ROW: tuple[Any, ...] = (None,) * 8
+    _FILE_LIST_ROW_KEYS: tuple[str, ...] = (
+        "url", "sha256", "title", "source_site", "source_page_url",
+        "original_filename", "local_path", "bytes", "content_type",
+        "last_modified", "etag", "published_time", "first_seen",
+        "last_seen", "crawl_time", "deleted_at",
+        "category", "summary", "keywords",
+        "markdown_content", "markdown_source", "markdown_updated_at",
+        "rag_chunk_count", "rag_indexed_at",
+    )
+    _FILE_DETAIL_ROW_KEYS: tuple[str, ...] = (
+        "url", "sha256", "title", "source_site", "source_page_url",
+        "original_filename", "local_path", "bytes", "content_type",
+        "last_modified", "etag", "published_time", "first_seen",
+        "last_seen", "crawl_time", "deleted_at",
+        "category", "summary", "keywords", "catalog_status",
+        "markdown_content", "markdown_updated_at", "markdown_source",
+        "catalog_version", "catalog_processed_at", "catalog_updated_at",
+        "rag_chunk_count", "rag_indexed_at",
+    )
 
     def iter_files(
         self,
@@ -1473,6 +1623,24 @@ class Storage:
         cur = self._conn.execute("SELECT COUNT(DISTINCT source_site) FROM files")
         return cur.fetchone()[0]
     
+    def get_dashboard_counts(self) -> tuple[int, int, int]:
+        """Get the dashboard counters in a single statement.
+        
+        Returns:
+            ``(get_file_count(require_local=True), get_cataloged_count(),
+            get_sources_count())``
+        """
+        cur = self._conn.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM files WHERE local_path IS NOT NULL AND local_path != ''),
+                (SELECT COUNT(*) FROM catalog_items WHERE status = 'ok'),
+                (SELECT COUNT(DISTINCT source_site) FROM files)
+            """
+        )
+        total_files, cataloged_files, total_sources = cur.fetchone()
+        return total_files, cataloged_files, total_sources
+    
     def get_unique_sources(self) -> list[str]:
         """Get list of unique source sites.
         
@@ -1505,159 +1673,275 @@ class Storage:
                 categories.add(part)
         return sorted(categories, key=lambda x: x.lower())
     
-    def query_files_with_catalog(
+    def _files_with_catalog_filters(
         self,
         *,
-        limit: int = 20,
-        offset: int = 0,
-        order_by: str = 'last_seen',
-        order_dir: str = 'desc',
-        query: str = '',
-        source: str = '',
-        category: str = '',
-        include_deleted: bool = False,
-    ) -> tuple[list[dict], int]:
-        """Query files with catalog information, filtering and pagination.
-        
-        Args:
-            limit: Maximum number of results
-            offset: Offset for pagination
-            order_by: Column to order by
-            order_dir: Order direction ('asc' or 'desc')
-            query: Search term for title/filename/url
-            source: Source site filter
-            category: Category filter
-            include_deleted: Whether to include deleted files
-            
-        Returns:
-            Tuple of (list of file dicts, total count)
+        query: str,
+        source: str,
+        category: str,
+        include_deleted: bool,
+    ) -> tuple[tuple[str, bool, str, bool], list[Any]]:
+        """Return the filter shape and bound params for file list queries.
+
+        The SQL text depends only on the shape, so requests with the same
+        filters present reuse one string (see ``_file_list_sql``) and hit
+        sqlite3's per-connection statement cache instead of being reparsed.
         """
-        # Validate and map order_by column using class-level mapping
-        if order_by not in self._QUERY_ORDER_COLUMN_MAP:
-            order_by = 'last_seen'  # default
-        order_column = self._QUERY_ORDER_COLUMN_MAP[order_by]
-        
-        # Validate order_dir to prevent SQL injection
-        if order_dir.lower() not in ['asc', 'desc']:
-            order_dir = 'desc'
-        
-        # Build query
+        params: list[Any] = []
+
+        # Bound in the same order as ``_file_list_sql`` emits the predicates.
+        if source:
+            params.append(f"%{source.lower()}%")
+
+        category_mode = ""
+        if category == '__uncategorized__':
+            category_mode = "uncategorized"
+        elif category:
+            category_mode = "match"
+            params.append(f"; {category};")
+
+        search = ""
+        if query:
+            search_term = f"%{query.lower()}%"
+            # The trigram tokenizer needs at least three characters to match;
+            # shorter terms keep the LIKE scan over the file columns.
+            if self._fts_enabled and len(query) >= 3:
+                search = "fts"
+                params.append('"' + query.replace('"', '""') + '"')
+            else:
+                search = "like"
+                params.extend([search_term] * 3)
+            params.extend([search_term] * 4)
+
+        return (search, bool(source), category_mode, include_deleted), params
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _file_list_sql(
+        shape: tuple[str, bool, str, bool],
+        order_column: str,
+        order_dir: str,
+        include_markdown_content: bool = True,
+    ) -> tuple[str, str, bool]:
+        """Build ``(count_sql, page_sql, joined)`` for one filter shape and order."""
+        search, has_source, category_mode, include_deleted = shape
         filters = []
-        
+
         # When not including deleted files, only show files with valid local_path
         # When including deleted files, show all (deleted files have local_path cleared)
         if not include_deleted:
             filters.append("f.local_path IS NOT NULL AND f.local_path != ''")
             filters.append("f.deleted_at IS NULL")
-        
-        params = []
-        
-        # Join with catalog_items when query/category filters need catalog fields,
-        # and later for result projection even without filters.
-        join_clause = ""
 
-        if query:
-            join_clause = "LEFT JOIN catalog_items c ON c.file_url = f.url"
+        # Remaining predicates go cheapest first: SQLite evaluates the
+        # non-indexed terms in this order and stops at the first false one.
+        if has_source:
+            # LIKE already folds ASCII case, which is all LOWER() folds too.
+            filters.append("f.source_site LIKE ?")
+
+        # Category filters probe catalog_items with a correlated EXISTS rather
+        # than joining, so the planner can keep walking the files sort index
+        # and stop as soon as a page is filled.
+        if category_mode == "uncategorized":
+            # Uncategorized: no catalog row, or a blank category/summary,
+            # or an internal "(...)" label.
+            filters.append(
+                "NOT EXISTS ("
+                "SELECT 1 FROM catalog_items ce WHERE ce.file_url = f.url "
+                "AND TRIM(IFNULL(ce.category, '')) != '' "
+                "AND TRIM(IFNULL(ce.summary, '')) != '' "
+                "AND TRIM(ce.category) NOT LIKE '(%)'"
+                ")"
+            )
+        elif category_mode == "match":
+            # Precise matching for semicolon-separated categories
+            # Category format: "AI; Risk & Capital; Pricing"
+            # Wrapping the list as "; AI; Risk & Capital; Pricing;" turns the
+            # exact/start/middle/end cases into one substring search for
+            # "; <category>;", with no LIKE wildcards in the user's value.
             filters.append(
-                "(LOWER(IFNULL(f.title, '')) LIKE ? "
-                "OR LOWER(IFNULL(f.original_filename, '')) LIKE ? "
-                "OR LOWER(IFNULL(f.url, '')) LIKE ? "
-                "OR LOWER(IFNULL(c.summary, '')) LIKE ? "
-                "OR LOWER(IFNULL(c.keywords, '')) LIKE ? "
-                "OR LOWER(IFNULL(c.category, '')) LIKE ? "
-                "OR LOWER(IFNULL(c.markdown_content, '')) LIKE ?)"
+                "EXISTS (SELECT 1 FROM catalog_items ce WHERE ce.file_url = f.url "
+                "AND instr('; ' || ce.category || ';', ?) > 0)"
             )
-            search_term = f"%{query.lower()}%"
-            params.extend([search_term] * 7)
-        
-        if source:
-            filters.append("LOWER(f.source_site) LIKE ?")
-            params.append(f"%{source.lower()}%")
-        
-        if category:
+
+        # Join with catalog_items only when the search needs catalog fields.
+        join_clause = ""
+
+        if search:
             join_clause = "LEFT JOIN catalog_items c ON c.file_url = f.url"
-            if category == '__uncategorized__':
-                filters.append(
-                    "("
-                    "c.file_url IS NULL "
-                    "OR TRIM(IFNULL(c.category, '')) = '' "
-                    "OR TRIM(IFNULL(c.summary, '')) = '' "
-                    "OR (TRIM(IFNULL(c.category, '')) != '' AND TRIM(IFNULL(c.category, '')) LIKE '(%)')"
-                    ")"
-                )
+            if search == "fts":
+                file_match = "f.id IN (SELECT rowid FROM files_fts WHERE files_fts MATCH ?)"
             else:
-                # Precise matching for semicolon-separated categories
-                # Category format: "AI; Risk & Capital; Pricing"
-                # Match exact string, OR start of list, OR end of list, OR middle of list
-                filters.append("(c.category = ? OR c.category LIKE ? OR c.category LIKE ? OR c.category LIKE ?)")
-                params.extend([category, f"{category};%", f"%; {category}", f"%; {category};%"])
-        
+                file_match = "f.title LIKE ? OR f.original_filename LIKE ? OR f.url LIKE ?"
+            # A NULL column makes its LIKE NULL, which the OR treats as false.
+            filters.append(
+                f"({file_match} "
+                "OR c.summary LIKE ? "
+                "OR c.keywords LIKE ? "
+                "OR c.category LIKE ? "
+                "OR c.markdown_content LIKE ?)"
+            )
+
         # Avoid empty WHERE which causes SQLite "incomplete input"
         where_clause = " AND ".join(filters) if filters else "1=1"
-        
-        # Get total count
-        count_query = f"""
+
+        count_sql = f"""
             SELECT COUNT(*)
             FROM files f
             {join_clause}
             WHERE {where_clause}
         """
-        cur = self._conn.execute(count_query, tuple(params))
-        total = cur.fetchone()[0]
-        
-        # Get files with catalog data using validated column mapping
-        # Always use LEFT JOIN to return category columns even if not filtering
-        if not join_clause:
-            join_clause = "LEFT JOIN catalog_items c ON c.file_url = f.url"
-        
-        order_clause = f"{order_column} {order_dir.upper()}"
-        query_sql = f"""
+        # When no filter needs catalog_items, page over files alone and pull
+        # the catalog columns for each fetched batch with one IN (...) lookup.
+        catalog_columns = Storage._FILE_LIST_CATALOG_COLUMNS_SQL if join_clause else ""
+        if not include_markdown_content:
+            # Full markdown bodies are the widest column; skip reading them
+            # when the caller will not return them.
+            catalog_columns = catalog_columns.replace("c.markdown_content", "NULL")
+        page_sql = f"""
             SELECT f.url, f.sha256, f.title, f.source_site, f.source_page_url,
                    f.original_filename, f.local_path, f.bytes, f.content_type,
                    f.last_modified, f.etag, f.published_time, f.first_seen,
-                   f.last_seen, f.crawl_time, f.deleted_at,
-                   c.category, c.summary, c.keywords,
-                   c.markdown_content, c.markdown_source, c.markdown_updated_at,
-                   c.rag_chunk_count, c.rag_indexed_at
+                   f.last_seen, f.crawl_time, f.deleted_at{catalog_columns}
             FROM files f
             {join_clause}
             WHERE {where_clause}
-            ORDER BY {order_clause}
+            ORDER BY {order_column} {order_dir}
             LIMIT ? OFFSET ?
         """
+        return count_sql, page_sql, bool(join_clause)
+
+    def count_files_with_catalog(
+        self,
+        *,
+        query: str = '',
+        source: str = '',
+        category: str = '',
+        include_deleted: bool = False,
+    ) -> int:
+        """Count files matching the same filters as ``query_files_with_catalog``."""
+        shape, params = self._files_with_catalog_filters(
+            query=query, source=source, category=category, include_deleted=include_deleted
+        )
+        count_sql, _, _ = self._file_list_sql(shape, "f.last_seen", "DESC")
+        cur = self._conn.execute(count_sql, params)
+        return cur.fetchone()[0]
+
+    def iter_files_with_catalog(
+        self,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: str = 'last_seen',
+        order_dir: str = 'desc',
+        query: str = '',
+        source: str = '',
+        category: str = '',
+        include_deleted: bool = False,
+        batch_size: int = 256,
+        include_markdown_content: bool = True,
+    ) -> Iterator[list[dict]]:
+        """Run the paged file list query and yield rows in ``fetchmany`` batches.
+
+        The query is executed before this returns, so SQL errors surface to the
+        caller immediately; only row fetching and mapping are deferred. With
+        ``include_markdown_content=False`` the ``markdown_content`` key is None.
+        """
+        # Map order_by/order_dir through class-level allowlists; unknown values
+        # fall back to the defaults, so nothing user-supplied reaches the SQL.
+        order_column = self._QUERY_ORDER_COLUMN_MAP.get(order_by, 'f.last_seen')
+        sql_order_dir = self._QUERY_ORDER_DIRECTIONS.get(order_dir.lower(), 'DESC')
+
+        shape, params = self._files_with_catalog_filters(
+            query=query, source=source, category=category, include_deleted=include_deleted
+        )
+        _, page_sql, joined = self._file_list_sql(
+            shape, order_column, sql_order_dir, include_markdown_content
+        )
         params.extend([limit, offset])
-        cur = self._conn.execute(query_sql, tuple(params))
-        
-        files = []
-        for row in cur.fetchall():
-            file_dict = {
-                "url": row[0],
-                "sha256": row[1],
-                "title": row[2],
-                "source_site": row[3],
-                "source_page_url": row[4],
-                "original_filename": row[5],
-                "local_path": row[6],
-                "bytes": row[7],
-                "content_type": row[8],
-                "last_modified": row[9],
-                "etag": row[10],
-                "published_time": row[11],
-                "first_seen": row[12],
-                "last_seen": row[13],
-                "crawl_time": row[14],
-                "deleted_at": row[15],
-                "category": row[16],
-                "summary": row[17],
-                "keywords": json.loads(row[18]) if row[18] else [],
-                "markdown_content": row[19],
-                "markdown_source": row[20],
-                "markdown_updated_at": row[21],
-                "rag_chunk_count": row[22] or 0,
-                "rag_indexed_at": row[23]
-            }
-            files.append(file_dict)
+        cur = self._conn.execute(page_sql, params)
+        return self._iter_file_catalog_batches(
+            cur, max(1, int(batch_size)), joined=joined, include_markdown_content=include_markdown_content
+        )
+
+    def _catalog_rows_for_urls(
+        self, urls: list[str], *, include_markdown_content: bool = True
+    ) -> dict[str, tuple[Any, ...]]:
+        if not urls:
+            return {}
+        markdown_column = "markdown_content" if include_markdown_content else "NULL"
+        # The URLs travel as one JSON array so the statement text is the same
+        # for every batch and stays in the connection's statement cache.
+        cur = self._conn.execute(
+            f"""
+            SELECT file_url, category, summary, keywords,
+                   {markdown_column}, markdown_source, markdown_updated_at,
+                   rag_chunk_count, rag_indexed_at
+            FROM catalog_items
+            WHERE file_url IN (SELECT value FROM json_each(?))
+            """,
+            (orjson.dumps(urls).decode(),),
+        )
+        return {row[0]: row[1:] for row in cur.fetchall()}
+
+    def _iter_file_catalog_batches(
+        self, cur: sqlite3.Cursor, batch_size: int, *, joined: bool, include_markdown_content: bool = True
+    ) -> Iterator[list[dict]]:
+        keys = self._FILE_LIST_ROW_KEYS
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                return
+            if not joined:
+                catalog = self._catalog_rows_for_urls(
+                    [row[0] for row in rows], include_markdown_content=include_markdown_content
+                )
+                empty = self._EMPTY_FILE_LIST_CATALOG_ROW
+                rows = [row + catalog.get(row[0], empty) for row in rows]
+            yield [_file_row_to_dict(keys, row) for row in rows]
+
+    def query_files_with_catalog(
+        self,
+        *,
+        limit: int = 20,
+        offset: int = 0,
+        order_by: str = 'last_seen',
+        order_dir: str = 'desc',
+        query: str = '',
+        source: str = '',
+        category: str = '',
+        include_deleted: bool = False,
+    ) -> tuple[list[dict], int]:
+        """Query files with catalog information, filtering and pagination.
         
+        Args:
+            limit: Maximum number of results
+            offset: Offset for pagination
+            order_by: Column to order by
+            order_dir: Order direction ('asc' or 'desc')
+            query: Search term for title/filename/url
+            source: Source site filter
+            category: Category filter
+            include_deleted: Whether to include deleted files
+            
+        Returns:
+            Tuple of (list of file dicts, total count)
+        """
+        total = self.count_files_with_catalog(
+            query=query, source=source, category=category, include_deleted=include_deleted
+        )
+        files: list[dict] = []
+        for batch in self.iter_files_with_catalog(
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            order_dir=order_dir,
+            query=query,
+            source=source,
+            category=category,
+            include_deleted=include_deleted,
+        ):
+            files.extend(batch)
         return files, total
     
     def list_files_first_seen_between(
@@ -1694,8 +1978,8 @@ class Storage:
             raw_keywords = item.get("keywords")
             if isinstance(raw_keywords, str) and raw_keywords.strip():
                 try:
-                    item["keywords"] = json.loads(raw_keywords)
-                except json.JSONDecodeError:
+                    item["keywords"] = orjson.loads(raw_keywords)
+                except orjson.JSONDecodeError:
                     item["keywords"] = [raw_keywords]
             elif raw_keywords in (None, ""):
                 item["keywords"] = []
@@ -1852,36 +2136,7 @@ class Storage:
         if not row:
             return None
         
-        return {
-            "url": row[0],
-            "sha256": row[1],
-            "title": row[2],
-            "source_site": row[3],
-            "source_page_url": row[4],
-            "original_filename": row[5],
-            "local_path": row[6],
-            "bytes": row[7],
-            "content_type": row[8],
-            "last_modified": row[9],
-            "etag": row[10],
-            "published_time": row[11],
-            "first_seen": row[12],
-            "last_seen": row[13],
-            "crawl_time": row[14],
-            "deleted_at": row[15],
-            "category": row[16],
-            "summary": row[17],
-            "keywords": json.loads(row[18]) if row[18] else [],
-            "catalog_status": row[19],
-            "markdown_content": row[20],
-            "markdown_updated_at": row[21],
-            "markdown_source": row[22],
-            "catalog_version": row[23],
-            "catalog_processed_at": row[24],
-            "catalog_updated_at": row[25],
-            "rag_chunk_count": row[26] or 0,
-            "rag_indexed_at": row[27],
-        }
+        return _file_row_to_dict(self._FILE_DETAIL_ROW_KEYS, row)
 
     def get_file_rag_kb_entries(self, file_url: str) -> list[dict]:
         """Return KB-level RAG metadata for a specific file.
@@ -3721,3 +3976,28 @@ class Storage:
         cur = self._conn.execute("SELECT * FROM user_activity_logs LIMIT 0")
         cols = [d[0] for d in cur.description]
         return [dict(zip(cols, r)) for r in rows]
+
+
+def thread_read_storage(db_path: str) -> Storage:
+    """Return this thread's long-lived, query-only ``Storage`` for ``db_path``.
+
+    Read-only request handlers run on a small, reused worker pool, so keeping
+    one connection per thread skips the connect/PRAGMA cost and keeps
+    SQLite's statement cache warm. Callers must not close the returned
+    handle. A database file that was replaced since the handle was opened
+    gets a fresh connection.
+    """
+    handles: dict[str, tuple[tuple[int, int] | None, Storage]] | None = getattr(_READ_STORAGE, "handles", None)
+    if handles is None:
+        handles = _READ_STORAGE.handles = {}
+    cached = handles.get(db_path)
+    if cached is not None:
+        schema_key, storage = cached
+        if schema_key is not None and storage._schema_key() == schema_key:
+            return storage
+        storage.close()
+        del handles[db_path]
+    storage = Storage(db_path)
+    storage._conn.execute("PRAGMA query_only=ON;")
+    handles[db_path] = (storage._schema_key(), storage)
+    return storage
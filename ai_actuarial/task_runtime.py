@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import json
+import itertools
 import logging
 import os
 import re
@@ -11,7 +11,7 @@ from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, time as datetime_time
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 from urllib.parse import urlparse
 
 import schedule
@@ -27,13 +27,42 @@ from ai_actuarial.crawler import Crawler, SiteConfig
 from ai_actuarial.rag.indexing import IndexingPipeline
 from ai_actuarial.rag.knowledge_base import KnowledgeBaseManager
 from ai_actuarial.search import search_all
-from ai_actuarial.shared_runtime import append_task_log, coerce_bool, get_sites_config_path, load_yaml, parse_int_clamped, task_log_path
+from ai_actuarial.shared_runtime import (
+    append_job_history,
+    append_task_log,
+    coerce_bool,
+    get_sites_config_path,
+    load_job_history_tail,
+    load_yaml,
+    parse_int_clamped,
+    task_log_path,
+)
 from ai_actuarial.storage import Storage
 
 logger = logging.getLogger(__name__)
 
 _QUERY_SITE_FILTER_RE = re.compile(r"(?:^|\s)site:([^\s)]+)", re.IGNORECASE)
 
+# In-memory task history is a bounded ring; the full record stays in job_history.jsonl
+# (rotated to job_history.jsonl.1 past shared_runtime.JOB_HISTORY_ROTATE_BYTES).
+TASK_HISTORY_MAXLEN = 500
+
+# Background tasks past this many wait as "pending" until a running one ends.
+MAX_CONCURRENT_TASKS = parse_int_clamped(os.getenv("MAX_CONCURRENT_TASKS"), default=4, min_value=1, max_value=64)
+# How often a queued task re-checks for a stop request while waiting for a slot.
+TASK_SLOT_POLL_SECONDS = 0.5
+# Progress callbacks publish a new task snapshot at most this often per task.
+PROGRESS_PUBLISH_INTERVAL_NS = 100_000_000
+
+# Every published task snapshot gets the next version; the per-process prefix
+# keeps ETags issued before a restart from matching the new counter.
+_SNAPSHOT_VERSIONS = itertools.count(1)
+_SNAPSHOT_EPOCH = secrets.token_hex(4)
+
+
+def _next_snapshot_etag() -> str:
+    return f'W/"{_SNAPSHOT_EPOCH}-{next(_SNAPSHOT_VERSIONS)}"'
+
 _CONVERTIBLE_MARKDOWN_PREDICATE = """
     f.local_path IS NOT NULL AND f.local_path != ''
     AND f.deleted_at IS NULL
@@ -155,10 +184,72 @@ def _new_scheduler() -> Any:
     return _FallbackScheduler()
 
 
+class ActiveTaskRegistry(dict):
+    """Active tasks keyed by id, plus a copy-on-write snapshot for readers.
+
+    Writers mutate the dict while holding the runtime's task lock and then call
+    ``publish()``. Readers call ``snapshot()``, which returns the last published
+    tuple of task copies without taking the lock, and ``stop_requested()``,
+    which checks the published set of task ids asked to stop. ``etag()``
+    changes on every publish; read it before ``snapshot()`` so a validator is
+    never paired with a newer body than the one it names.
+    """
+
+    __slots__ = ("_snapshot", "_stop_requested", "_etag")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._snapshot: tuple[dict[str, Any], ...] = ()
+        self._stop_requested: frozenset[str] = frozenset()
+        self._etag = _next_snapshot_etag()
+
+    def publish(self) -> None:
+        self._snapshot = tuple(dict(task) for task in self.values())
+        self._stop_requested = frozenset(task_id for task_id, task in self.items() if task.get("stop_requested"))
+        self._etag = _next_snapshot_etag()
+
+    def snapshot(self) -> tuple[dict[str, Any], ...]:
+        return self._snapshot
+
+    def etag(self) -> str:
+        return self._etag
+
+    def stop_requested(self, task_id: str) -> bool:
+        return task_id in self._stop_requested
+
+
+class TaskHistory(deque):
+    """Bounded task history with a copy-on-write snapshot for readers.
+
+    Entries are not mutated once appended, so ``append()`` republishes the
+    snapshot itself; writers keep appending under the runtime's task lock and
+    ``snapshot()`` returns the last published tuple without taking it.
+    ``etag()`` follows the same publish-order rule as ``ActiveTaskRegistry``.
+    """
+
+    __slots__ = ("_snapshot", "_etag")
+
+    def __init__(self, iterable: Iterable[dict[str, Any]] = (), maxlen: int | None = None) -> None:
+        super().__init__(iterable, maxlen)
+        self._snapshot: tuple[dict[str, Any], ...] = tuple(self)
+        self._etag = _next_snapshot_etag()
+
+    def append(self, item: dict[str, Any]) -> None:
+        super().append(item)
+        self._snapshot = tuple(self)
+        self._etag = _next_snapshot_etag()
+
+    def snapshot(self) -> tuple[dict[str, Any], ...]:
+        return self._snapshot
+
+    def etag(self) -> str:
+        return self._etag
+
+
 @dataclass(slots=True)
 class RuntimeRefs:
-    active_tasks_ref: dict[str, dict[str, Any]]
-    task_history_ref: list[dict[str, Any]]
+    active_tasks_ref: ActiveTaskRegistry
+    task_history_ref: TaskHistory
     task_lock: threading.RLock
     schedule_ref: schedule.Scheduler
     start_background_task: Callable[..., str]
@@ -168,29 +259,34 @@ class RuntimeRefs:
 
 class NativeTaskRuntime:
     def __init__(self) -> None:
-        self.active_tasks: dict[str, dict[str, Any]] = {}
-        self.task_history: list[dict[str, Any]] = self._load_history_from_disk()
+        self.active_tasks = ActiveTaskRegistry()
+        self.task_history = TaskHistory(self._load_history_from_disk(), maxlen=TASK_HISTORY_MAXLEN)
         self.task_lock = threading.RLock()
+        self._task_slots = threading.BoundedSemaphore(MAX_CONCURRENT_TASKS)
         self.scheduler = _new_scheduler()
         self._scheduler_lock = threading.RLock()
         self._scheduler_loop_started = False
         self._site_config_override: dict[str, Any] | None = None
+        self._data_changed_callbacks: list[Callable[[], None]] = []
+
+    def on_data_changed(self, callback: Callable[[], None]) -> None:
+        """Register ``callback`` to run after a finished task may have written to the database.
+
+        The API app hooks its read/download cache invalidation in here, so this
+        module never imports the HTTP layer.
+        """
+        self._data_changed_callbacks.append(callback)
+
+    def _notify_data_changed(self) -> None:
+        for callback in self._data_changed_callbacks:
+            try:
+                callback()
+            except Exception:  # noqa: BLE001
+                logger.exception("Data-changed callback %r failed", callback)
 
     def _load_history_from_disk(self) -> list[dict[str, Any]]:
-        path = Path("data/job_history.jsonl")
-        if not path.exists():
-            return []
         try:
-            rows: deque[dict[str, Any]] = deque(maxlen=100)
-            with path.open("r", encoding="utf-8") as handle:
-                for line_no, line in enumerate(handle, start=1):
-                    if not line.strip():
-                        continue
-                    try:
-                        rows.append(json.loads(line))
-                    except json.JSONDecodeError as exc:
-                        logger.warning("Skipping malformed job history line %s in %s: %s", line_no, path, exc)
-            return list(rows)
+            return load_job_history_tail(100)
         except Exception as exc:  # noqa: BLE001
             logger.error("Failed to load job history: %s", exc)
             return []
@@ -235,6 +331,7 @@ class NativeTaskRuntime:
             "items_total": 0,
             "items_downloaded": 0,
             "items_skipped": 0,
+            "current_activity": "Queued",
             "log_file": str(task_log_path(task_id)),
             "errors": [],
         }
@@ -242,10 +339,12 @@ class NativeTaskRuntime:
             task_data.update(extra_fields)
         with self.task_lock:
             self.active_tasks[task_id] = task_data
+            self.active_tasks.publish()
         append_task_log(task_id, "INFO", f"Task created (type={collection_type})")
         thread = threading.Thread(
             target=self._execute_collection_task,
             args=(task_id, collection_type, dict(data)),
+            name=f"collect-{task_id}",
             daemon=True,
         )
         thread.start()
@@ -343,6 +442,38 @@ class NativeTaskRuntime:
             logger.error("Failed to parse schedule '%s': %s", interval_str, exc)
 
     def _execute_collection_task(self, task_id: str, collection_type: str, data: dict[str, Any]) -> None:
+        # Daemon threads gated by a semaphore rather than a ThreadPoolExecutor,
+        # whose workers are joined at interpreter exit and would hold shutdown
+        # until every running crawl finished. The wait is polled so a task
+        # stopped while queued ends without waiting for a slot.
+        while not self._task_slots.acquire(timeout=TASK_SLOT_POLL_SECONDS):
+            if self._stop_requested(task_id):
+                self._finalize_stopped_before_start(task_id, collection_type)
+                return
+        try:
+            if self._stop_requested(task_id):
+                self._finalize_stopped_before_start(task_id, collection_type)
+                return
+            self._run_collection_task(task_id, collection_type, data)
+        finally:
+            self._task_slots.release()
+
+    def _finalize_stopped_before_start(self, task_id: str, collection_type: str) -> None:
+        append_task_log(task_id, "INFO", "Task stopped before it started")
+        self._finalize_task_success(
+            task_id,
+            collection_type,
+            CollectionResult(
+                success=True,
+                items_found=0,
+                items_downloaded=0,
+                items_skipped=0,
+                errors=[],
+                metadata={"stopped": True},
+            ),
+        )
+
+    def _run_collection_task(self, task_id: str, collection_type: str, data: dict[str, Any]) -> None:
         self._update_task(task_id, status="running", current_activity=f"Starting {collection_type} task")
         append_task_log(task_id, "INFO", f"Starting background task (type={collection_type})")
         try:
@@ -367,7 +498,9 @@ class NativeTaskRuntime:
         storage = Storage(db_path)
         try:
             if collection_type == "file":
-                collector = FileCollector(storage, download_dir)
+                collector = FileCollector(
+                    storage, download_dir, stop_check=lambda: self._stop_requested(task_id)
+                )
                 file_paths = self._collect_file_paths(data)
                 cfg = CollectionConfig(
                     name=str(data.get("name") or "File Import"),
@@ -1365,7 +1498,7 @@ class NativeTaskRuntime:
         allowed_exts = {str(ext).lower().lstrip('.') for ext in raw_exts if str(ext).strip()}
         paths = file_paths_for_batch(upload_batch_id)
         if allowed_exts:
-            paths = [path for path in paths if Path(path).suffix.lower().lstrip('.') in allowed_exts]
+            paths = [path for path in paths if os.path.splitext(path)[1].lower().lstrip('.') in allowed_exts]
         return paths
 
     def _site_configs_for_run(self, config: dict[str, Any], data: dict[str, Any]) -> list[SiteConfig]:
@@ -1611,12 +1744,35 @@ class NativeTaskRuntime:
         return max(min_value, parsed)
 
     def _stop_requested(self, task_id: str) -> bool:
-        with self.task_lock:
-            task = self.active_tasks.get(task_id)
-            return bool(task and task.get("stop_requested"))
+        # Polled by crawlers and per-item loops; reads the published stop set
+        # instead of taking the task lock on every iteration.
+        return self.active_tasks.stop_requested(task_id)
 
     def _progress_callback(self, task_id: str) -> Callable[[int, int, str], None]:
+        # Snapshot publishes are coalesced to one per PROGRESS_PUBLISH_INTERVAL_NS.
+        # A throttled update is kept and flushed by a one-shot timer, so the
+        # latest state shows within one interval even if the task then stalls.
+        # Every message still goes to the task log.
+        state_lock = threading.Lock()
+        pending: dict[str, Any] = {}
+        last_publish_ns = 0
+        flush_timer: threading.Timer | None = None
+
+        def flush() -> None:
+            nonlocal last_publish_ns, flush_timer
+            with state_lock:
+                flush_timer = None
+                if not pending:
+                    return
+                fields = dict(pending)
+                pending.clear()
+                last_publish_ns = time.monotonic_ns()
+                # Published under state_lock so an older flush never lands
+                # after a newer one.
+                self._update_task(task_id, **fields)
+
         def callback(current: int, total: int, message: str) -> None:
+            nonlocal flush_timer
             try:
                 current_int = int(current or 0)
             except (TypeError, ValueError):
@@ -1628,13 +1784,21 @@ class NativeTaskRuntime:
             progress = 0
             if total_int > 0:
                 progress = min(100, max(0, int((current_int / total_int) * 100)))
-            self._update_task(
-                task_id,
-                progress=progress,
-                items_processed=current_int,
-                items_total=total_int,
-                current_activity=message,
-            )
+            with state_lock:
+                pending.update(
+                    progress=progress,
+                    items_processed=current_int,
+                    items_total=total_int,
+                    current_activity=message,
+                )
+                wait_ns = PROGRESS_PUBLISH_INTERVAL_NS - (time.monotonic_ns() - last_publish_ns)
+                due = progress >= 100 or wait_ns <= 0
+                if not due and flush_timer is None:
+                    flush_timer = threading.Timer(wait_ns / 1_000_000_000, flush)
+                    flush_timer.daemon = True
+                    flush_timer.start()
+            if due:
+                flush()
             append_task_log(task_id, "INFO", message)
 
         return callback
@@ -1644,10 +1808,12 @@ class NativeTaskRuntime:
             task = self.active_tasks.get(task_id)
             if task is not None:
                 task.update(fields)
+                self.active_tasks.publish()
 
     def _finalize_task_success(self, task_id: str, collection_type: str, result: CollectionResult) -> None:
         with self.task_lock:
             task_data = self.active_tasks.pop(task_id, None)
+            self.active_tasks.publish()
         if task_data is None:
             return
         stopped = bool((result.metadata or {}).get("stopped"))
@@ -1666,12 +1832,17 @@ class NativeTaskRuntime:
             }
         )
         append_task_log(task_id, "INFO", f"Task finished (type={collection_type}, success={result.success})")
-        self.task_history.append(task_data)
-        self._append_history_to_disk(task_data)
+        # Markdown, chunking and catalog tasks write rows without counting
+        # downloads, so every finished task invalidates.
+        self._notify_data_changed()
+        with self.task_lock:
+            self.task_history.append(task_data)
+        append_job_history(task_data)
 
     def _finalize_task_error(self, task_id: str, error: str) -> None:
         with self.task_lock:
             task_data = self.active_tasks.pop(task_id, None)
+            self.active_tasks.publish()
         if task_data is None:
             return
         task_data.update(
@@ -1684,11 +1855,8 @@ class NativeTaskRuntime:
             }
         )
         append_task_log(task_id, "ERROR", f"Task failed: {error}")
-        self.task_history.append(task_data)
-        self._append_history_to_disk(task_data)
-
-    def _append_history_to_disk(self, task_data: dict[str, Any]) -> None:
-        path = Path("data/job_history.jsonl")
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(task_data, ensure_ascii=False) + "\n")
+        # A failed task may still have written rows before it raised.
+        self._notify_data_changed()
+        with self.task_lock:
+            self.task_history.append(task_data)
+        append_job_history(task_data)
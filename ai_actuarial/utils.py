@@ -153,6 +153,8 @@ def load_category_config(config_path: str = "config/categories.yaml") -> dict:
     """
     try:
         import yaml
+
+        from ai_actuarial.shared_runtime import YAML_LOADER
     except ImportError:
         raise ImportError("PyYAML is required to load category configuration")
     
@@ -162,6 +164,6 @@ def load_category_config(config_path: str = "config/categories.yaml") -> dict:
     
     try:
         with open(path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            return yaml.load(f, Loader=YAML_LOADER)
     except yaml.YAMLError:
         raise
@@ -8,6 +8,7 @@ import yaml
 from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
 from ai_actuarial.security import UnsafeUrlError, ensure_safe_http_url
+from ai_actuarial.shared_runtime import YAML_DUMPER, YAML_LOADER
 
 SCHEMA_VERSION = "web-listening-agent-rule.v1"
 DEFAULT_FILE_EXTS = [".pdf", ".doc", ".docx", ".ppt", ".pptx", ".xls", ".xlsx"]
@@ -140,7 +141,7 @@ class MaterializedConfig(BaseModel):
 def rule_from_yaml_or_dict(value: str | dict[str, Any]) -> WebListeningAgentRuleV1:
     if isinstance(value, str):
         try:
-            parsed = yaml.safe_load(value) or {}
+            parsed = yaml.load(value, Loader=YAML_LOADER) or {}
         except yaml.YAMLError as exc:
             raise WebListeningRuleError(f"Invalid YAML: {exc}") from exc
     elif isinstance(value, dict):
@@ -204,7 +205,7 @@ def generate_draft_rule(*, website_url: str, goal: str, name: str | None = None)
 
 
 def rule_to_yaml(rule: WebListeningAgentRuleV1) -> str:
-    return yaml.safe_dump(rule.model_dump(mode="json"), sort_keys=False, allow_unicode=True)
+    return yaml.dump(rule.model_dump(mode="json"), Dumper=YAML_DUMPER, sort_keys=False, allow_unicode=True)
 
 
 def materialize_rule(rule: WebListeningAgentRuleV1) -> MaterializedConfig:
@@ -16,6 +16,7 @@ from ai_actuarial.rag.defaults import (
     get_embedding_batch_size_default,
     get_similarity_threshold_default,
 )
+from ai_actuarial.shared_runtime import YAML_LOADER
 
 logger = logging.getLogger(__name__)
 
@@ -115,7 +116,7 @@ def _load_yaml_config_cached(
     
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=YAML_LOADER)
             logger.info(f"Loaded configuration from {config_path}")
             return config or {}
     except FileNotFoundError:
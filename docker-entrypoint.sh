@@ -23,4 +23,4 @@ if ! dpkg -s libxcb1 >/dev/null 2>&1; then
 fi
 
 echo "Starting application..."
-exec python -m ai_actuarial api --host "${FASTAPI_HOST:-0.0.0.0}" --port "${FASTAPI_PORT:-5000}"
+exec python -m ai_actuarial api --host "${FASTAPI_HOST:-0.0.0.0}" --port "${FASTAPI_PORT:-5000}" --workers "${FASTAPI_WORKERS:-1}"
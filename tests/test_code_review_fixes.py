@@ -21,7 +21,7 @@ import time
 import unittest
 from pathlib import Path
 
-from ai_actuarial.storage import Storage
+from ai_actuarial.storage import Storage, thread_read_storage
 from ai_actuarial.catalog_incremental import _connect, _count_candidates, _upsert_catalog_row
 from ai_actuarial.crawler import Crawler
 from ai_actuarial.catalog import CatalogItem
@@ -307,6 +307,64 @@ class TestStorageAbstraction(unittest.TestCase):
         count = self.storage.get_sources_count()
         self.assertEqual(count, 2)
     
+    def test_get_dashboard_counts(self):
+        """Test get_dashboard_counts matches the individual counters."""
+        self.storage.insert_file(
+            url="http://test.com/file1.pdf",
+            sha256="hash1",
+            title="File 1",
+            source_site="test.com",
+            source_page_url="http://test.com",
+            original_filename="file1.pdf",
+            local_path="/tmp/file1.pdf",
+            bytes=1024,
+            content_type="application/pdf",
+        )
+        self.storage.insert_file(
+            url="http://example.com/file2.pdf",
+            sha256="hash2",
+            title="File 2",
+            source_site="example.com",
+            source_page_url="http://example.com",
+            original_filename="file2.pdf",
+            local_path="",
+            bytes=2048,
+            content_type="application/pdf",
+        )
+        self.storage.upsert_catalog_item(
+            item={
+                "url": "http://test.com/file1.pdf",
+                "sha256": "hash1",
+                "keywords": ["test"],
+                "summary": "Test summary",
+                "category": "Test",
+            },
+            pipeline_version="v1",
+            status="ok",
+        )
+        
+        self.assertEqual(self.storage.get_dashboard_counts(), (1, 1, 2))
+
+    def test_thread_read_storage_is_reused_and_query_only(self):
+        """Test thread_read_storage keeps one query-only handle per thread."""
+        reader = thread_read_storage(self.db_path)
+        self.assertIs(thread_read_storage(self.db_path), reader)
+        with self.assertRaises(sqlite3.OperationalError):
+            reader._conn.execute("DELETE FROM files")
+
+        self.storage.insert_file(
+            url="http://test.com/file1.pdf",
+            sha256="hash1",
+            title="File 1",
+            source_site="test.com",
+            source_page_url="http://test.com",
+            original_filename="file1.pdf",
+            local_path="/tmp/file1.pdf",
+            bytes=1024,
+            content_type="application/pdf",
+        )
+        self.assertEqual(reader.get_unique_sources(), ["test.com"])
+    
     def test_get_unique_sources(self):
         """Test get_unique_sources method."""
         self.storage.insert_file(
@@ -14,3 +14,12 @@ def test_mistralai_is_pinned_to_supported_version() -> None:
     version = pins[0].split("==", 1)[1]
     assert Version(version) >= Version("1.12.4")
     assert "mistralai==1.0.0" not in requirements
+
+
+def test_fastapi_floor_includes_pydantic_json_serialization() -> None:
+    requirements = (ROOT / "requirements.txt").read_text(encoding="utf-8").splitlines()
+    pins = [line for line in requirements if line.startswith("fastapi>=")]
+
+    assert len(pins) == 1
+    # 0.130.0 serializes annotated route returns straight to JSON bytes via pydantic-core.
+    assert Version(pins[0].split(">=", 1)[1]) >= Version("0.130.0")
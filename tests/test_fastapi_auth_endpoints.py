@@ -612,6 +612,13 @@ def test_fastapi_admin_user_and_token_management_surfaces_work(tmp_path: Path, m
     assert activity.status_code == 200, activity.text
     assert "activity" in activity.json()
 
+    clamped = client.get(
+        f"/api/admin/users/{seed['user_id']}/activity?limit=999999&offset=-5",
+        headers=headers,
+    )
+    assert clamped.status_code == 200, clamped.text
+    assert (clamped.json()["limit"], clamped.json()["offset"]) == (200, 0)
+
     token_create = client.post(
         "/api/auth/tokens",
         json={"subject": "reader@example.com", "group_name": "reader"},
@@ -163,3 +163,26 @@ def test_fastapi_uses_rebound_legacy_task_history_reference(monkeypatch, tmp_pat
         "task-history-8",
         "task-history-9",
     ]
+
+
+def test_fastapi_rejected_run_lands_in_empty_bounded_task_history(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FASTAPI_SESSION_SECRET", "fastapi-entrypoint-test-secret")
+    monkeypatch.setenv("BOOTSTRAP_ADMIN_TOKEN", "entrypoint-admin-token")
+    headers = {"X-Auth-Token": "entrypoint-admin-token"}
+
+    app = create_app()
+    assert len(app.state.task_history_ref) == 0
+    assert app.state.task_history_ref.maxlen is not None
+    client = TestClient(app)
+
+    rejected = client.post("/api/collections/run", json={"type": "not-a-type"}, headers=headers)
+    assert rejected.status_code == 400
+
+    history = client.get("/api/tasks/history", headers=headers).json()["tasks"]
+    assert [task["status"] for task in history] == ["error"]
+    assert history[0]["id"].startswith("rejected_")
+
+    client.post("/api/collections/run", json={"type": "not-a-type"}, headers=headers)
+    history = client.get("/api/tasks/history", headers=headers).json()["tasks"]
+    assert len({task["id"] for task in history}) == 2
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import hashlib
+import sqlite3
 from pathlib import Path
 
 import yaml
@@ -193,3 +194,93 @@ def test_fastapi_file_mutations_download_and_export_work(tmp_path: Path, monkeyp
     files_after_delete = client.get("/api/files?include_deleted=true", headers=headers)
     deleted = next(item for item in files_after_delete.json()["files"] if item["url"] == seed["beta_url"])
     assert deleted["deleted_at"]
+
+
+
+def test_fastapi_download_resolves_relative_paths_and_404s_missing_files(tmp_path: Path, monkeypatch) -> None:
+    client, _app, seed = _build_test_client(tmp_path, monkeypatch)
+    headers = {"Authorization": f"Bearer {seed['operator_token']}"}
+
+    # Relative to the download dir itself (the fallback after its parent).
+    with sqlite3.connect(tmp_path / "index.db") as conn:
+        conn.execute("UPDATE files SET local_path = ? WHERE url = ?", ("alpha.pdf", seed["alpha_url"]))
+    relative = client.get("/api/download", params={"url": seed["alpha_url"]}, headers=headers)
+    assert relative.status_code == 200, relative.text
+    assert relative.content == PDF_BYTES
+
+    Path(seed["alpha_path"]).unlink()
+    missing = client.get("/api/download", params={"url": seed["alpha_url"]}, headers=headers)
+    assert missing.status_code == 404
+
+
+
+def test_fastapi_download_reuses_resolved_path_until_invalidated(tmp_path: Path, monkeypatch) -> None:
+    from ai_actuarial.api.services.files_write import invalidate_download_cache
+
+    client, _app, seed = _build_test_client(tmp_path, monkeypatch)
+    headers = {"Authorization": f"Bearer {seed['operator_token']}"}
+    params = {"url": seed["alpha_url"]}
+    lookups: list[str] = []
+    original_lookup = Storage.get_file_by_url
+
+    def counting_lookup(self, url):
+        lookups.append(url)
+        return original_lookup(self, url)
+
+    monkeypatch.setattr(Storage, "get_file_by_url", counting_lookup)
+
+    assert client.get("/api/download", params=params, headers=headers).content == PDF_BYTES
+    assert client.get("/api/download", params=params, headers=headers).content == PDF_BYTES
+    assert lookups == [seed["alpha_url"]]
+
+    invalidate_download_cache(str(tmp_path / "index.db"))
+    assert client.get("/api/download", params=params, headers=headers).status_code == 200
+    assert lookups == [seed["alpha_url"], seed["alpha_url"]]
+
+
+def test_fastapi_download_honours_conditional_and_range_requests(tmp_path: Path, monkeypatch) -> None:
+    client, _app, seed = _build_test_client(tmp_path, monkeypatch)
+    headers = {"Authorization": f"Bearer {seed['operator_token']}"}
+    params = {"url": seed["alpha_url"]}
+
+    full = client.get("/api/download", params=params, headers=headers)
+    assert full.status_code == 200
+    etag = full.headers["etag"]
+    last_modified = full.headers["last-modified"]
+
+    by_etag = client.get("/api/download", params=params, headers={**headers, "If-None-Match": etag})
+    assert by_etag.status_code == 304
+    assert by_etag.content == b""
+    assert by_etag.headers["etag"] == etag
+
+    by_date = client.get("/api/download", params=params, headers={**headers, "If-Modified-Since": last_modified})
+    assert by_date.status_code == 304
+
+    stale = client.get("/api/download", params=params, headers={**headers, "If-None-Match": '"other"'})
+    assert stale.status_code == 200
+    assert stale.content == PDF_BYTES
+
+    ranged = client.get("/api/download", params=params, headers={**headers, "Range": "bytes=0-3"})
+    assert ranged.status_code == 206
+    assert ranged.content == PDF_BYTES[:4]
+
+
+
+def test_fastapi_download_can_be_offloaded_to_reverse_proxy(tmp_path: Path, monkeypatch) -> None:
+    from ai_actuarial.config import settings
+
+    client, _app, seed = _build_test_client(tmp_path, monkeypatch)
+    headers = {"Authorization": f"Bearer {seed['operator_token']}"}
+
+    monkeypatch.setattr(settings, "DOWNLOAD_OFFLOAD", "x-accel-redirect")
+    monkeypatch.setattr(settings, "DOWNLOAD_ACCEL_PREFIX", "/protected-files/")
+    accel = client.get("/api/download", params={"url": seed["alpha_url"]}, headers=headers)
+    assert accel.status_code == 200, accel.text
+    assert accel.content == b""
+    assert accel.headers["x-accel-redirect"] == "/protected-files/files/alpha.pdf"
+    assert accel.headers["content-type"] == "application/pdf"
+    assert accel.headers["content-disposition"] == 'attachment; filename="doc-a.pdf"'
+
+    monkeypatch.setattr(settings, "DOWNLOAD_OFFLOAD", "x-sendfile")
+    sendfile = client.get("/api/download", params={"url": seed["alpha_url"]}, headers=headers)
+    assert sendfile.headers["x-sendfile"] == str(Path(seed["alpha_path"]).resolve())
@@ -461,6 +461,70 @@ def test_fastapi_ops_read_routes_require_operator_access_when_auth_enabled(tmp_p
     assert "Completed task" in log_response.json()["log"]
 
 
+def test_fastapi_config_sites_serves_etag_and_revalidates_after_yaml_change(tmp_path: Path, monkeypatch) -> None:
+    client, _app, seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+    headers = {"X-Auth-Token": seed["admin_token"]}
+
+    first = client.get("/api/config/sites", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert first.json()["sites"][0]["name"] == "Alpha Site"
+
+    not_modified = client.get("/api/config/sites", headers={**headers, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+
+    config_path = tmp_path / "sites.yaml"
+    config = yaml.safe_load(config_path.read_text(encoding="utf-8"))
+    config["sites"][0]["name"] = "Renamed Site"
+    config_path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+
+    changed = client.get("/api/config/sites", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["sites"][0]["name"] == "Renamed Site"
+
+
+def test_fastapi_task_lists_serve_etag_and_revalidate_after_publish(tmp_path: Path, monkeypatch) -> None:
+    from ai_actuarial.task_runtime import ActiveTaskRegistry, TaskHistory
+
+    client, app, seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+    headers = {"X-Auth-Token": seed["admin_token"]}
+    active_tasks = ActiveTaskRegistry()
+    active_tasks["task-live"] = {"id": "task-live", "status": "running", "progress": 10}
+    active_tasks.publish()
+    task_history = TaskHistory(maxlen=10)
+    task_history.append({"id": "task-old", "status": "completed", "started_at": "2026-04-15T05:00:00"})
+    app.state.active_tasks_ref = active_tasks
+    app.state.task_history_ref = task_history
+    app.state.task_lock = threading.RLock()
+
+    first = client.get("/api/tasks/active", headers=headers)
+    etag = first.headers["etag"]
+    assert first.json()["tasks"][0]["progress"] == 10
+    not_modified = client.get("/api/tasks/active", headers={**headers, "If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    active_tasks["task-live"]["progress"] = 60
+    active_tasks.publish()
+    changed = client.get("/api/tasks/active", headers={**headers, "If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert changed.json()["tasks"][0]["progress"] == 60
+
+    history_etag = client.get("/api/tasks/history", headers=headers).headers["etag"]
+    assert client.get("/api/tasks/history", headers={**headers, "If-None-Match": history_etag}).status_code == 304
+    other_limit = client.get("/api/tasks/history?limit=1", headers={**headers, "If-None-Match": history_etag})
+    assert other_limit.status_code == 200
+    assert other_limit.headers["etag"] != history_etag
+    task_history.append({"id": "task-new", "status": "completed", "started_at": "2026-04-16T05:00:00"})
+    refreshed = client.get("/api/tasks/history", headers={**headers, "If-None-Match": history_etag})
+    assert refreshed.status_code == 200
+    assert [task["id"] for task in refreshed.json()["tasks"]] == ["task-new", "task-old"]
+
+
 def test_fastapi_ai_config_registry_credentials_and_routing_read_endpoints(tmp_path: Path, monkeypatch) -> None:
     _patch_available_models(monkeypatch)
     client, app, seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
@@ -758,6 +758,23 @@ def test_upload_batch_then_run_file_collection_uses_batch_not_server_path(tmp_pa
     assert "directory_path" not in recorder.started[-1][1]
 
 
+def test_file_collection_rejects_unknown_upload_batch(tmp_path: Path, monkeypatch) -> None:
+    _patch_available_models(monkeypatch)
+    client, app, seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+    recorder = _BridgeRecorder()
+    _install_bridge(app, recorder)
+
+    response = client.post(
+        "/api/collections/run",
+        json={"type": "file", "name": "Import PDFs", "upload_batch_id": "0" * 32},
+        headers={"X-Auth-Token": seed["operator_token"]},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error"] == "Upload batch not found"
+    assert recorder.started == []
+
+
 def test_import_batch_rejects_readers_and_path_traversal(tmp_path: Path, monkeypatch) -> None:
     _patch_available_models(monkeypatch)
     client, _app, seed = _build_test_client(tmp_path, monkeypatch, require_auth=True)
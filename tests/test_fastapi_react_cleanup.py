@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from ai_actuarial.cli import build_parser
+from ai_actuarial.cli import _site_configs, build_parser
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -17,6 +17,32 @@ def test_cli_exposes_fastapi_api_command_without_legacy_web_command() -> None:
     assert "web" not in choices
 
 
+def test_cli_api_workers_default_from_env(monkeypatch) -> None:
+    monkeypatch.delenv("FASTAPI_WORKERS", raising=False)
+    assert build_parser().parse_args(["api"]).workers == 1
+
+    monkeypatch.setenv("FASTAPI_WORKERS", "4")
+    assert build_parser().parse_args(["api"]).workers == 4
+    assert build_parser().parse_args(["api", "--workers", "2"]).workers == 2
+
+
+def test_cli_site_configs_merge_exclusions_in_config_order() -> None:
+    cfg = {
+        "defaults": {"exclude_keywords": ["draft", "archive"], "exclude_prefixes": None},
+        "sites": [
+            {"name": "A", "url": "https://a.example", "exclude_keywords": ["archive", "minutes"]},
+            {"name": "B", "url": "https://b.example", "exclude_prefixes": ["https://b.example/old"]},
+        ],
+    }
+
+    first, second = _site_configs(cfg)
+
+    assert first.exclude_keywords == ["draft", "archive", "minutes"]
+    assert first.exclude_prefixes == []
+    assert second.exclude_keywords == ["draft", "archive"]
+    assert second.exclude_prefixes == ["https://b.example/old"]
+
+
 def test_runtime_tree_no_longer_contains_legacy_web_assets() -> None:
     assert not (ROOT / "ai_actuarial" / "web").exists()
 
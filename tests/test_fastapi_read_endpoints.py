@@ -10,6 +10,7 @@ from fastapi.testclient import TestClient
 from itsdangerous import URLSafeSerializer
 
 from ai_actuarial.api.app import create_app
+from ai_actuarial.api.services.read import invalidate_read_cache
 from ai_actuarial.storage import Storage
 
 
@@ -241,6 +242,15 @@ def test_fastapi_files_supports_filters_sorting_and_deleted(tmp_path: Path, monk
     assert filtered_body["files"][0]["title"] == "Alpha Document"
     assert filtered_body["files"][0]["category"] == "AI; Risk"
 
+    last_in_list = client.get("/api/files?category=Risk").json()
+    assert [item["title"] for item in last_in_list["files"]] == ["Alpha Document"]
+    assert client.get("/api/files?category=Ris").json()["total"] == 0
+    assert client.get("/api/files?category=A_").json()["total"] == 0
+
+    by_source = client.get("/api/files?source=BETA&category=Pricing&query=Be").json()
+    assert [item["title"] for item in by_source["files"]] == ["Beta Document"]
+    assert client.get("/api/files?source=beta&category=AI").json()["total"] == 0
+
     summary_search = client.get("/api/files?query=Beta%20summary")
     assert summary_search.status_code == 200
     summary_body = summary_search.json()
@@ -279,6 +289,98 @@ def test_fastapi_files_supports_filters_sorting_and_deleted(tmp_path: Path, monk
     ]
 
 
+def test_fastapi_files_streams_batches_and_empty_pages(tmp_path: Path, monkeypatch) -> None:
+    client, app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+
+    storage = Storage(app.state.db_path)
+    try:
+        batches = list(storage.iter_files_with_catalog(order_by="title", order_dir="asc", batch_size=1))
+        without_markdown = [
+            row
+            for search in ("", "document")
+            for batch in storage.iter_files_with_catalog(query=search, include_markdown_content=False)
+            for row in batch
+        ]
+    finally:
+        storage.close()
+    assert len(without_markdown) == 4
+    assert all(row["markdown_content"] is None for row in without_markdown)
+    assert any(row["markdown_source"] for row in without_markdown)
+    assert [[row["title"] for row in batch] for batch in batches] == [["Alpha Document"], ["Beta Document"]]
+    assert batches[0][0]["keywords"] == ["ai"]
+
+    response = client.get("/api/files?limit=1&offset=1&order_by=title&order_dir=asc")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert (body["total"], body["has_more"], body["limit"], body["offset"]) == (2, False, 1, 1)
+    assert [item["title"] for item in body["files"]] == ["Beta Document"]
+
+    empty = client.get("/api/files?offset=50")
+    assert empty.status_code == 200
+    assert empty.json() == {"files": [], "total": 2, "has_more": False, "limit": 20, "offset": 50}
+
+    normalized = client.get("/api/files?limit=1&order_by=bogus&order_dir=ASC").json()
+    assert normalized["total"] == 2
+    assert len(normalized["files"]) == 1
+
+    first_page = client.get("/api/files?limit=1&include_total=false&order_by=title&order_dir=asc").json()
+    assert [item["title"] for item in first_page["files"]] == ["Alpha Document"]
+    assert (first_page["total"], first_page["has_more"]) == (None, True)
+
+    last_page = client.get("/api/files?limit=1&offset=1&include_total=false").json()
+    assert len(last_page["files"]) == 1
+    assert (last_page["total"], last_page["has_more"]) == (None, False)
+
+    count_calls: list[dict[str, object]] = []
+    original_count = Storage.count_files_with_catalog
+
+    def _counting(self, **kwargs):
+        count_calls.append(kwargs)
+        return original_count(self, **kwargs)
+
+    monkeypatch.setattr(Storage, "count_files_with_catalog", _counting)
+    short_page = client.get("/api/files?limit=10").json()
+    assert (short_page["total"], short_page["has_more"]) == (2, False)
+    assert count_calls == []
+
+    invalidate_read_cache(str(app.state.db_path))
+    full_page = client.get("/api/files?limit=1").json()
+    assert (full_page["total"], full_page["has_more"]) == (2, True)
+    assert len(count_calls) == 1
+
+    next_page = client.get("/api/files?limit=1&offset=1").json()
+    assert next_page["total"] == 2
+    assert len(count_calls) == 1
+
+
+def test_fastapi_files_title_search_uses_fts_index(tmp_path: Path, monkeypatch) -> None:
+    client, app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+
+    mid_word = client.get("/api/files?query=PHA%20DOC")
+    assert [item["title"] for item in mid_word.json()["files"]] == ["Alpha Document"]
+
+    by_filename = client.get("/api/files?query=doc-b")
+    assert [item["title"] for item in by_filename.json()["files"]] == ["Beta Document"]
+
+    short_term = client.get("/api/files?query=b.")
+    assert [item["title"] for item in short_term.json()["files"]] == ["Beta Document"]
+
+    storage = Storage(app.state.db_path)
+    try:
+        storage._conn.execute(
+            "UPDATE files SET title = ? WHERE url = ?",
+            ("Renamed Report", "https://beta.example/doc-b.docx"),
+        )
+        storage._conn.commit()
+    finally:
+        storage.close()
+
+    assert client.get("/api/files?query=beta%20doc").json()["total"] == 0
+    renamed = client.get("/api/files?query=renamed")
+    assert [item["title"] for item in renamed.json()["files"]] == ["Renamed Report"]
+
+
 def test_fastapi_native_read_routes_keep_public_reads_available_under_require_auth(tmp_path: Path, monkeypatch) -> None:
     client, _app, seed = _build_test_client(tmp_path, monkeypatch, require_auth=True)
 
@@ -346,6 +448,119 @@ def test_fastapi_sources_file_detail_and_markdown_match_legacy_contract(tmp_path
     assert unknown_markdown.json() == {"success": True, "markdown": None}
 
 
+def test_fastapi_sources_are_cached_until_ttl_or_force_refresh(tmp_path: Path, monkeypatch) -> None:
+    client, app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+
+    assert client.get("/api/sources").json()["sources"] == ["alpha.example", "beta.example", "gamma.example"]
+
+    storage = Storage(str(app.state.db_path))
+    try:
+        storage.insert_file(
+            url="https://delta.example/doc-d.pdf",
+            sha256="hash-delta",
+            title="Delta Document",
+            source_site="delta.example",
+            source_page_url="https://delta.example",
+            original_filename="doc-d.pdf",
+            local_path="/tmp/doc-d.pdf",
+            bytes=10,
+            content_type="application/pdf",
+        )
+    finally:
+        storage.close()
+
+    cached = client.get("/api/sources")
+    assert cached.headers["content-type"] == "application/json"
+    assert "delta.example" not in cached.json()["sources"]
+
+    refreshed = client.get("/api/sources?force_refresh=1")
+    assert "delta.example" in refreshed.json()["sources"]
+
+
+def test_fastapi_stats_counts_are_cached_until_invalidated(tmp_path: Path, monkeypatch) -> None:
+    client, app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+
+    assert client.get("/api/stats").json()["total_files"] == 2
+
+    storage = Storage(str(app.state.db_path))
+    try:
+        storage.insert_file(
+            url="https://delta.example/doc-d.pdf",
+            sha256="hash-delta",
+            title="Delta Document",
+            source_site="delta.example",
+            source_page_url="https://delta.example",
+            original_filename="doc-d.pdf",
+            local_path="/tmp/doc-d.pdf",
+            bytes=10,
+            content_type="application/pdf",
+        )
+    finally:
+        storage.close()
+
+    assert client.get("/api/stats").json()["total_files"] == 2
+
+    invalidate_read_cache(str(app.state.db_path))
+    assert client.get("/api/stats").json()["total_files"] == 3
+
+
+def test_fastapi_files_total_is_cached_per_filter_until_invalidated(tmp_path: Path, monkeypatch) -> None:
+    client, app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+
+    assert client.get("/api/files?limit=1").json()["total"] == 2
+
+    storage = Storage(str(app.state.db_path))
+    try:
+        storage.insert_file(
+            url="https://delta.example/doc-d.pdf",
+            sha256="hash-delta",
+            title="Delta Document",
+            source_site="delta.example",
+            source_page_url="https://delta.example",
+            original_filename="doc-d.pdf",
+            local_path="/tmp/doc-d.pdf",
+            bytes=10,
+            content_type="application/pdf",
+        )
+    finally:
+        storage.close()
+
+    assert client.get("/api/files?limit=1&offset=1").json()["total"] == 2
+    assert client.get("/api/files?limit=1&source=delta").json()["total"] == 1
+
+    invalidate_read_cache(str(app.state.db_path))
+    assert client.get("/api/files?limit=1").json()["total"] == 3
+
+
+def test_fastapi_files_total_cache_is_dropped_by_markdown_edits(tmp_path: Path, monkeypatch) -> None:
+    from ai_actuarial.api.services.files_write import update_file_markdown_content
+
+    client, app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+
+    assert client.get("/api/files?limit=1&query=markdown content").json()["total"] == 1
+
+    update_file_markdown_content(
+        db_path=str(app.state.db_path),
+        url="https://beta.example/doc-b.docx",
+        payload={"markdown_content": "Beta markdown content"},
+    )
+
+    assert client.get("/api/files?limit=1&query=markdown content").json()["total"] == 2
+
+
+def test_fastapi_configured_categories_follow_categories_yaml_edits(tmp_path: Path, monkeypatch) -> None:
+    client, _app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+
+    assert client.get("/api/categories").json()["categories"] == ["AI", "Pricing", "Reserve"]
+
+    categories_path = tmp_path / "categories.yaml"
+    config = yaml.safe_load(categories_path.read_text(encoding="utf-8"))
+    config["categories"]["Solvency"] = ["solvency"]
+    categories_path.write_text(yaml.safe_dump(config, sort_keys=False), encoding="utf-8")
+
+    assert client.get("/api/categories").json()["categories"] == ["AI", "Pricing", "Reserve", "Solvency"]
+
+
 def test_fastapi_markdown_route_preserves_percent_encoded_file_urls(tmp_path: Path, monkeypatch) -> None:
     client, app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
 
@@ -399,3 +614,16 @@ def test_fastapi_native_read_routes_accept_fastapi_session_cookie(tmp_path: Path
     markdown = client.get(f"/api/files/{quote('https://alpha.example/doc-a.pdf', safe='')}/markdown")
     assert markdown.status_code == 200
     assert markdown.json()["markdown"]["markdown_source"] == "manual"
+
+
+def test_fastapi_json_responses_are_gzipped_when_accepted(tmp_path: Path, monkeypatch) -> None:
+    client, _app, _seed = _build_test_client(tmp_path, monkeypatch, require_auth=False)
+
+    compressed = client.get("/api/files", headers={"Accept-Encoding": "gzip"})
+    assert compressed.status_code == 200
+    assert compressed.headers["content-encoding"] == "gzip"
+    assert compressed.json()["total"] == 2
+
+    plain = client.get("/api/files", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == compressed.json()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import inspect
+
+import pytest
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+
+from ai_actuarial.api.responses import OrjsonResponse
+from ai_actuarial.api.routers import (
+    agentic_rag,
+    auth,
+    chat,
+    files_write,
+    ops_read,
+    ops_write,
+    rag_admin,
+    read,
+)
+
+
+def _api_routes(module) -> list[APIRoute]:
+    return [route for route in module.router.routes if isinstance(route, APIRoute)]
+
+
+@pytest.mark.parametrize("module", [agentic_rag, auth, chat, files_write, ops_write, rag_admin])
+def test_unannotated_routers_render_with_orjson(module) -> None:
+    for route in _api_routes(module):
+        assert route.response_class is OrjsonResponse, route.path
+
+
+@pytest.mark.parametrize("module", [ops_read, read])
+def test_annotated_routers_keep_pydantic_dump_json_path(module) -> None:
+    for route in _api_routes(module):
+        assert inspect.signature(route.endpoint).return_annotation is not inspect.Signature.empty, route.path
+        assert isinstance(route.response_class, DefaultPlaceholder), route.path
+
+
+def test_orjson_response_matches_stdlib_for_non_string_keys() -> None:
+    assert OrjsonResponse({"files": [{"id": 1, "title": "Résumé"}], 2: None}).body == (
+        '{"files":[{"id":1,"title":"Résumé"}],"2":null}'.encode("utf-8")
+    )
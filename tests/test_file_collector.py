@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from ai_actuarial.collectors import CollectionConfig
+from ai_actuarial.collectors.file import HASH_WINDOW, FileCollector
+from ai_actuarial.storage import Storage
+
+
+def test_file_collector_skips_excluded_names_before_hashing(tmp_path: Path, monkeypatch) -> None:
+    source_dir = tmp_path / "incoming"
+    source_dir.mkdir()
+    kept = source_dir / "Annual Report.pdf"
+    kept.write_bytes(b"report")
+    excluded = source_dir / "DRAFT notes.pdf"
+    excluded.write_bytes(b"draft")
+
+    storage = Storage(str(tmp_path / "index.db"))
+    try:
+        collector = FileCollector(storage, str(tmp_path / "data" / "files"))
+        hashed: list[str] = []
+        original_hash = collector._calculate_sha256
+
+        def _tracking_hash(path: Path) -> str:
+            hashed.append(path.name)
+            return original_hash(path)
+
+        monkeypatch.setattr(collector, "_calculate_sha256", _tracking_hash)
+        result = collector.collect(
+            CollectionConfig(
+                name="Import",
+                source_type="file",
+                exclude_keywords=["Draft"],
+                metadata={"file_paths": [str(kept), str(excluded), str(source_dir), str(source_dir / "gone.pdf")]},
+            )
+        )
+        imported = storage.get_file_by_url(f"file://{kept}")
+    finally:
+        storage.close()
+
+    assert hashed == ["Annual Report.pdf"]
+    assert (result.items_found, result.items_downloaded, result.items_skipped) == (2, 1, 1)
+    assert [error.split(":")[0] for error in result.errors] == ["Not a file", "File not found"]
+    assert imported is not None
+    assert imported["local_path"] == str(Path("files") / "imported" / "Annual Report.pdf")
+
+
+def test_file_collector_hashes_ahead_but_dedupes_in_order(tmp_path: Path, monkeypatch) -> None:
+    source_dir = tmp_path / "incoming"
+    source_dir.mkdir()
+    paths = []
+    for name, content in [("a.pdf", b"same"), ("b.pdf", b"other"), ("c.pdf", b"same"), ("d.pdf", b"locked")]:
+        path = source_dir / name
+        path.write_bytes(content)
+        paths.append(path)
+
+    storage = Storage(str(tmp_path / "index.db"))
+    try:
+        collector = FileCollector(storage, str(tmp_path / "data" / "files"))
+        original_hash = collector._calculate_sha256
+
+        def _hash(path: Path) -> str:
+            if path.name == "d.pdf":
+                raise PermissionError("denied")
+            return original_hash(path)
+
+        monkeypatch.setattr(collector, "_calculate_sha256", _hash)
+        result = collector.collect(
+            CollectionConfig(name="Import", source_type="file", metadata={"file_paths": [str(p) for p in paths]})
+        )
+        imported = [bool(storage.get_file_by_url(f"file://{p}")) for p in paths]
+    finally:
+        storage.close()
+
+    assert imported == [True, True, False, False]
+    assert (result.items_found, result.items_downloaded, result.items_skipped) == (4, 2, 1)
+    assert result.errors == [f"Error importing file {paths[3]}: denied"]
+
+
+def test_file_collector_stops_without_hashing_the_rest(tmp_path: Path, monkeypatch) -> None:
+    source_dir = tmp_path / "incoming"
+    source_dir.mkdir()
+    paths = []
+    for index in range(HASH_WINDOW * 4):
+        path = source_dir / f"report-{index:02d}.pdf"
+        path.write_bytes(f"report {index}".encode())
+        paths.append(path)
+
+    storage = Storage(str(tmp_path / "index.db"))
+    try:
+        processing: list[str] = []
+        collector = FileCollector(
+            storage, str(tmp_path / "data" / "files"), stop_check=lambda: bool(processing)
+        )
+        hashed: list[str] = []
+        original_hash = collector._calculate_sha256
+
+        def _tracking_hash(path: Path) -> str:
+            hashed.append(path.name)
+            return original_hash(path)
+
+        monkeypatch.setattr(collector, "_calculate_sha256", _tracking_hash)
+        result = collector.collect(
+            CollectionConfig(name="Import", source_type="file", metadata={"file_paths": [str(p) for p in paths]}),
+            progress_callback=lambda current, total, message: (
+                processing.append(message) if message.startswith("Processing") else None
+            ),
+        )
+    finally:
+        storage.close()
+
+    assert result.metadata["stopped"] is True
+    assert result.items_downloaded == 1
+    assert len(hashed) <= HASH_WINDOW + 1
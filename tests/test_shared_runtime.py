@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from ai_actuarial import shared_runtime
+from ai_actuarial.shared_runtime import load_yaml_cached
+
+
+def test_load_yaml_cached_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    config_path = tmp_path / "categories.yaml"
+    config_path.write_text("categories:\n  Pricing: []\n", encoding="utf-8")
+
+    first = load_yaml_cached(str(config_path))
+    second = load_yaml_cached(str(config_path))
+    assert first is second
+    assert list(first["categories"]) == ["Pricing"]
+
+    config_path.write_text("categories:\n  Pricing: []\n  Reserving: []\n", encoding="utf-8")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    third = load_yaml_cached(str(config_path))
+    assert third is not first
+    assert list(third["categories"]) == ["Pricing", "Reserving"]
+
+
+def test_load_yaml_cached_returns_default_for_missing_file(tmp_path: Path) -> None:
+    result = load_yaml_cached(str(tmp_path / "missing.yaml"), default={"sites": []})
+    assert result == {"sites": []}
+
+
+def test_load_yaml_cached_detects_replaced_file_with_same_mtime_and_size(tmp_path: Path) -> None:
+    config_path = tmp_path / "sites.yaml"
+    config_path.write_text("sites: [a]\n", encoding="utf-8")
+    original = config_path.stat()
+    assert load_yaml_cached(str(config_path)) == {"sites": ["a"]}
+
+    replacement = tmp_path / "sites.yaml.tmp"
+    replacement.write_text("sites: [b]\n", encoding="utf-8")
+    os.utime(replacement, ns=(original.st_atime_ns, original.st_mtime_ns))
+    os.replace(replacement, config_path)
+
+    assert load_yaml_cached(str(config_path)) == {"sites": ["b"]}
+
+
+def test_load_yaml_cached_returns_read_only_view(tmp_path: Path) -> None:
+    config_path = tmp_path / "sites.yaml"
+    config_path.write_text("sites: [a]\n", encoding="utf-8")
+
+    config = load_yaml_cached(str(config_path))
+    with pytest.raises(TypeError):
+        config["sites"] = ["b"]  # type: ignore[index]
+    assert load_yaml_cached(str(config_path)) == {"sites": ["a"]}
+
+
+def test_append_job_history_writes_one_json_line_per_task(tmp_path: Path, monkeypatch) -> None:
+    history_path = tmp_path / "data" / "job_history.jsonl"
+    monkeypatch.setattr(shared_runtime, "JOB_HISTORY_PATH", history_path)
+
+    shared_runtime.append_job_history({"id": "t1", "name": "Årsrapport"})
+    shared_runtime.append_job_history({"id": "t2", "metadata": {1: "one"}})
+
+    lines = history_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"id": "t1", "name": "Årsrapport"},
+        {"id": "t2", "metadata": {"1": "one"}},
+    ]
+
+
+def test_load_job_history_tail_reads_last_records_and_rotates_large_files(tmp_path: Path, monkeypatch) -> None:
+    history_path = tmp_path / "job_history.jsonl"
+    monkeypatch.setattr(shared_runtime, "JOB_HISTORY_PATH", history_path)
+    monkeypatch.setattr(shared_runtime, "_JOB_HISTORY_TAIL_BLOCK", 64)
+    padding = "x" * 40
+    lines = [json.dumps({"id": f"t{index}", "pad": padding}) for index in range(50)]
+    lines.insert(45, "{not json")
+    history_path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+
+    rows = shared_runtime.load_job_history_tail(6)
+    assert [row["id"] for row in rows] == ["t45", "t46", "t47", "t48", "t49"]
+    assert history_path.exists()
+
+    monkeypatch.setattr(shared_runtime, "JOB_HISTORY_ROTATE_BYTES", 1024)
+    rows = shared_runtime.load_job_history_tail(3)
+    assert [row["id"] for row in rows] == ["t47", "t48", "t49"]
+    assert not history_path.exists()
+    assert (tmp_path / "job_history.jsonl.1").exists()
+    assert shared_runtime.load_job_history_tail(3) == []
+
+
+@pytest.mark.parametrize("max_lines", [1, 3, 20, 200])
+def test_tail_text_file_matches_full_read(tmp_path: Path, monkeypatch, max_lines: int) -> None:
+    monkeypatch.setattr(shared_runtime, "_TAIL_TEXT_BLOCK", 16)
+    log_path = tmp_path / "app.log"
+    lines = [f"[INFO] line {index} – ok\r\n" if index % 7 == 0 else f"[INFO] line {index}\n" for index in range(60)]
+    log_path.write_bytes(("".join(lines) + "[INFO] unterminated").encode("utf-8"))
+
+    with log_path.open("r", encoding="utf-8") as handle:
+        expected = "".join(handle.readlines()[-max_lines:])
+
+    assert shared_runtime.tail_text_file(log_path, max_lines=max_lines) == expected
+
+
+def test_tail_text_file_handles_missing_and_empty_files(tmp_path: Path) -> None:
+    assert shared_runtime.tail_text_file(tmp_path / "missing.log") == ""
+    empty = tmp_path / "empty.log"
+    empty.write_text("", encoding="utf-8")
+    assert shared_runtime.tail_text_file(empty) == ""
+    assert shared_runtime.tail_text_file(empty, max_lines=0) == ""
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ai_actuarial.storage import Storage
+
+
+@pytest.fixture()
+def storage(tmp_path: Path):
+    store = Storage(str(tmp_path / "index.db"))
+    try:
+        for index in range(5):
+            store.insert_file(
+                url=f"https://example.com/doc-{index}.pdf",
+                sha256=f"hash-{index}",
+                title=f"Document {index}",
+                source_site="example.com",
+                source_page_url="https://example.com",
+                original_filename=f"doc-{index}.pdf",
+                local_path=f"/tmp/doc-{index}.pdf",
+                bytes=100 * index,
+                content_type="application/pdf",
+            )
+        yield store
+    finally:
+        store.close()
+
+
+@pytest.mark.parametrize("order_by", ["last_seen", "first_seen", "crawl_time", "title", "source_site", "bytes"])
+def test_default_file_list_order_is_served_by_partial_index(storage: Storage, order_by: str) -> None:
+    order_column = Storage._QUERY_ORDER_COLUMN_MAP[order_by]
+    plan = storage._conn.execute(
+        f"""
+        EXPLAIN QUERY PLAN
+        SELECT f.url, c.category FROM files f
+        LEFT JOIN catalog_items c ON c.file_url = f.url
+        WHERE f.local_path IS NOT NULL AND f.local_path != '' AND f.deleted_at IS NULL
+        ORDER BY {order_column} DESC
+        LIMIT 20 OFFSET 0
+        """
+    ).fetchall()
+    details = " ".join(row[3] for row in plan)
+
+    assert f"idx_files_listed_{order_by}" in details
+    assert "TEMP B-TREE" not in details
+
+
+def test_first_seen_period_query_range_scans_live_index(storage: Storage) -> None:
+    plan = storage._conn.execute(
+        """
+        EXPLAIN QUERY PLAN
+        SELECT f.url FROM files f
+        LEFT JOIN catalog_items ci ON ci.file_url = f.url
+        WHERE f.deleted_at IS NULL
+          AND f.first_seen IS NOT NULL
+          AND f.first_seen >= ?
+          AND f.first_seen < ?
+        ORDER BY f.first_seen DESC, f.url ASC
+        LIMIT 500
+        """,
+        ("2026-01-01", "2026-01-08"),
+    ).fetchall()
+    details = " ".join(row[3] for row in plan)
+
+    assert "idx_files_live_first_seen (first_seen>? AND first_seen<?)" in details
+    assert "SCAN f" not in details
+
+
+def test_unfiltered_file_list_merges_catalog_fields_per_batch(storage: Storage) -> None:
+    storage.upsert_catalog_item(
+        item={
+            "url": "https://example.com/doc-3.pdf",
+            "sha256": "hash-3",
+            "keywords": ["pricing"],
+            "summary": "Doc three",
+            "category": "Pricing",
+        },
+        pipeline_version="v1",
+        status="ok",
+    )
+
+    batches = list(storage.iter_files_with_catalog(order_by="title", order_dir="asc", batch_size=2))
+    rows = [row for batch in batches for row in batch]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    by_url = {row["url"]: row for row in rows}
+    assert by_url["https://example.com/doc-3.pdf"]["category"] == "Pricing"
+    assert by_url["https://example.com/doc-3.pdf"]["keywords"] == ["pricing"]
+    assert by_url["https://example.com/doc-0.pdf"]["category"] is None
+    assert by_url["https://example.com/doc-0.pdf"]["keywords"] == []
+    assert by_url["https://example.com/doc-0.pdf"]["rag_chunk_count"] == 0
+
+
+def test_file_detail_maps_catalog_fields_by_name(storage: Storage) -> None:
+    storage.upsert_catalog_item(
+        item={
+            "url": "https://example.com/doc-1.pdf",
+            "sha256": "hash-1",
+            "keywords": ["reserving"],
+            "summary": "Doc one",
+            "category": "Reserving",
+        },
+        pipeline_version="v1",
+        status="ok",
+    )
+
+    detail = storage.get_file_with_catalog("https://example.com/doc-1.pdf")
+    bare = storage.get_file_with_catalog("https://example.com/doc-2.pdf")
+
+    assert detail is not None and bare is not None
+    assert set(detail) == set(Storage._FILE_DETAIL_ROW_KEYS)
+    assert detail["title"] == "Document 1"
+    assert detail["category"] == "Reserving"
+    assert detail["catalog_status"] == "ok"
+    assert detail["keywords"] == ["reserving"]
+    assert bare["keywords"] == []
+    assert bare["rag_chunk_count"] == 0
+    assert storage.get_file_with_catalog("https://example.com/missing.pdf") is None
+
+
+def test_first_seen_period_listing_decodes_keywords(storage: Storage) -> None:
+    storage.upsert_catalog_item(
+        item={"url": "https://example.com/doc-1.pdf", "sha256": "hash-1", "keywords": ["capital"]},
+        pipeline_version="v1",
+        status="ok",
+    )
+    storage.upsert_catalog_item(
+        item={"url": "https://example.com/doc-2.pdf", "sha256": "hash-2"},
+        pipeline_version="v1",
+        status="ok",
+    )
+    storage._conn.execute(
+        "UPDATE catalog_items SET keywords = ? WHERE file_url = ?",
+        ("legacy text", "https://example.com/doc-2.pdf"),
+    )
+
+    rows = storage.list_files_first_seen_between(period_start="2000-01-01", period_end="2999-01-01")
+    keywords = {row["url"]: row["keywords"] for row in rows}
+
+    assert keywords["https://example.com/doc-1.pdf"] == ["capital"]
+    assert keywords["https://example.com/doc-2.pdf"] == ["legacy text"]
+    assert keywords["https://example.com/doc-0.pdf"] == []
+
+
+def test_category_filters_probe_catalog_items(storage: Storage) -> None:
+    for index, category in ((1, "AI; Pricing"), (2, "(pending)")):
+        storage.upsert_catalog_item(
+            item={
+                "url": f"https://example.com/doc-{index}.pdf",
+                "sha256": f"hash-{index}",
+                "keywords": [],
+                "summary": f"Doc {index}",
+                "category": category,
+            },
+            pipeline_version="v1",
+            status="ok",
+        )
+
+    pricing, pricing_total = storage.query_files_with_catalog(category="Pricing")
+    assert pricing_total == 1
+    assert [row["url"] for row in pricing] == ["https://example.com/doc-1.pdf"]
+    assert pricing[0]["category"] == "AI; Pricing"
+
+    uncategorized, uncategorized_total = storage.query_files_with_catalog(
+        category="__uncategorized__", order_by="title", order_dir="asc"
+    )
+    assert uncategorized_total == 4
+    assert "https://example.com/doc-1.pdf" not in {row["url"] for row in uncategorized}
+
+    shape, params = storage._files_with_catalog_filters(query="", source="", category="Pricing", include_deleted=False)
+    _, page_sql, _ = storage._file_list_sql(shape, "f.last_seen", "DESC")
+    plan = " ".join(row[3] for row in storage._conn.execute(f"EXPLAIN QUERY PLAN {page_sql}", [*params, 20, 0]))
+    assert "sqlite_autoindex_catalog_items_1 (file_url=?)" in plan
+    assert not storage._conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'idx_catalog_items_file_url_category'"
+    ).fetchone()
+
+
+def test_file_list_sql_is_reused_per_filter_shape(storage: Storage) -> None:
+    first_shape, first_params = storage._files_with_catalog_filters(
+        query="doc", source="example", category="", include_deleted=False
+    )
+    second_shape, second_params = storage._files_with_catalog_filters(
+        query="report", source="other", category="", include_deleted=False
+    )
+
+    assert first_shape == second_shape
+    assert first_params != second_params
+    assert Storage._file_list_sql(first_shape, "f.title", "ASC") is Storage._file_list_sql(
+        second_shape, "f.title", "ASC"
+    )
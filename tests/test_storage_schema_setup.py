@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ai_actuarial.storage import Storage
+
+
+def test_schema_setup_runs_once_per_database_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    db_path = str(tmp_path / "index.db")
+    Storage(db_path).close()
+
+    def _fail(self: Storage) -> None:
+        raise AssertionError("schema setup should be skipped")
+
+    monkeypatch.setattr(Storage, "_init_schema", _fail)
+    storage = Storage(db_path)
+    try:
+        assert storage._fts_enabled is True
+        assert storage.get_file_count() == 0
+    finally:
+        storage.close()
+
+
+def test_schema_setup_reruns_for_recreated_database_file(tmp_path: Path) -> None:
+    db_path = tmp_path / "index.db"
+    Storage(str(db_path)).close()
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+    db_path.touch()
+
+    storage = Storage(str(db_path))
+    try:
+        assert storage.get_file_count() == 0
+    finally:
+        storage.close()
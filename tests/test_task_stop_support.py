@@ -1830,3 +1830,227 @@ def test_native_task_runtime_chunk_generation_rejects_invalid_binding_mode(tmp_p
                 "binding_mode": "invalid",
             },
         )
+
+
+def test_native_task_runtime_publishes_active_task_snapshots(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    from ai_actuarial.task_runtime import NativeTaskRuntime
+
+    runtime = NativeTaskRuntime()
+    with runtime.task_lock:
+        runtime.active_tasks["task-snap"] = {"id": "task-snap", "progress": 0}
+        runtime.active_tasks.publish()
+    before = runtime.active_tasks.snapshot()
+
+    runtime._update_task("task-snap", progress=40, current_activity="Halfway")
+
+    assert before[0]["progress"] == 0
+    after = runtime.active_tasks.snapshot()
+    assert [(task["id"], task["progress"]) for task in after] == [("task-snap", 40)]
+    assert after[0] is not runtime.active_tasks["task-snap"]
+
+
+def test_native_task_runtime_sees_stop_requests_through_published_set(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    from types import SimpleNamespace
+
+    from ai_actuarial.api.services.ops_write import BridgeState, request_task_stop
+    from ai_actuarial.task_runtime import NativeTaskRuntime
+
+    runtime = NativeTaskRuntime()
+    with runtime.task_lock:
+        runtime.active_tasks["task-stop"] = {"id": "task-stop", "progress": 0}
+        runtime.active_tasks.publish()
+    assert runtime._stop_requested("task-stop") is False
+
+    bridge = BridgeState(SimpleNamespace(active_tasks_ref=runtime.active_tasks, task_lock=runtime.task_lock))
+    request_task_stop("task-stop", bridge=bridge)
+
+    assert runtime._stop_requested("task-stop") is True
+    assert runtime._stop_requested("task-other") is False
+
+
+def test_native_task_runtime_publishes_task_history_snapshots(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    from ai_actuarial.task_runtime import TASK_HISTORY_MAXLEN, NativeTaskRuntime
+
+    runtime = NativeTaskRuntime()
+    before = runtime.task_history.snapshot()
+    with runtime.task_lock:
+        for index in range(TASK_HISTORY_MAXLEN + 1):
+            runtime.task_history.append({"id": f"task-{index}"})
+
+    assert before == ()
+    after = runtime.task_history.snapshot()
+    assert len(after) == TASK_HISTORY_MAXLEN
+    assert after[0]["id"] == "task-1"
+    assert after[-1]["id"] == f"task-{TASK_HISTORY_MAXLEN}"
+
+
+def test_native_task_runtime_queues_tasks_beyond_concurrency_limit(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    import threading
+    import time
+
+    from ai_actuarial.task_runtime import NativeTaskRuntime
+
+    runtime = NativeTaskRuntime()
+    runtime._task_slots = threading.BoundedSemaphore(1)
+    release = threading.Event()
+    started: list[str] = []
+
+    def fake_run(task_id, collection_type, data):
+        started.append(task_id)
+        release.wait(5)
+        return CollectionResult(success=True, items_found=0, items_downloaded=0, items_skipped=0, errors=[])
+
+    monkeypatch.setattr(runtime, "_run_collection", fake_run)
+
+    first = runtime.start_background_task("file", {})
+    for _ in range(100):
+        if started:
+            break
+        time.sleep(0.01)
+    second = runtime.start_background_task("file", {})
+    time.sleep(0.05)
+
+    assert started == [first]
+    assert runtime.active_tasks[second]["status"] == "pending"
+
+    runtime._update_task(second, stop_requested=True)
+    release.set()
+    for _ in range(200):
+        if len(runtime.task_history.snapshot()) == 2:
+            break
+        time.sleep(0.01)
+
+    history = {task["id"]: task for task in runtime.task_history.snapshot()}
+    assert started == [first]
+    assert history[first]["status"] == "completed"
+    assert history[second]["status"] == "stopped"
+
+
+def test_native_task_runtime_stops_queued_task_while_slots_are_busy(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+    import threading
+    import time
+
+    from ai_actuarial import task_runtime
+    from ai_actuarial.task_runtime import NativeTaskRuntime
+
+    monkeypatch.setattr(task_runtime, "TASK_SLOT_POLL_SECONDS", 0.01)
+    runtime = NativeTaskRuntime()
+    runtime._task_slots = threading.BoundedSemaphore(1)
+    release = threading.Event()
+    started: list[str] = []
+
+    def fake_run(task_id, collection_type, data):
+        started.append(task_id)
+        release.wait(5)
+        return CollectionResult(success=True, items_found=0, items_downloaded=0, items_skipped=0, errors=[])
+
+    monkeypatch.setattr(runtime, "_run_collection", fake_run)
+
+    first = runtime.start_background_task("file", {})
+    for _ in range(100):
+        if started:
+            break
+        time.sleep(0.01)
+    second = runtime.start_background_task("file", {})
+    runtime._update_task(second, stop_requested=True)
+    try:
+        for _ in range(200):
+            if second not in runtime.active_tasks:
+                break
+            time.sleep(0.01)
+
+        history = {task["id"]: task for task in runtime.task_history.snapshot()}
+        assert history[second]["status"] == "stopped"
+        assert runtime.active_tasks[first]["status"] == "running"
+        assert started == [first]
+    finally:
+        release.set()
+        # Let the running task finish while the cwd is still tmp_path, so its
+        # log and job history land there rather than in the repo.
+        for thread in threading.enumerate():
+            if thread.name == f"collect-{first}":
+                thread.join(5)
+
+
+def test_progress_callback_coalesces_rapid_updates_and_flushes_the_latest(monkeypatch) -> None:
+    from ai_actuarial import task_runtime
+    from ai_actuarial.task_runtime import NativeTaskRuntime
+
+    clock = [1_000_000_000]
+    timers: list[tuple[float, object]] = []
+
+    class FakeTimer:
+        def __init__(self, interval, function):
+            self.daemon = False
+            timers.append((interval, function))
+
+        def start(self) -> None:
+            pass
+
+    monkeypatch.setattr(task_runtime.time, "monotonic_ns", lambda: clock[0])
+    monkeypatch.setattr(task_runtime.threading, "Timer", FakeTimer)
+    logged: list[str] = []
+    monkeypatch.setattr(
+        task_runtime,
+        "append_task_log",
+        lambda task_id, level, message: logged.append(message) if task_id == "task-progress" else None,
+    )
+    runtime = NativeTaskRuntime()
+    published: list[tuple[int, str]] = []
+    monkeypatch.setattr(
+        runtime,
+        "_update_task",
+        lambda task_id, **fields: published.append((fields["items_processed"], fields["current_activity"])),
+    )
+
+    callback = runtime._progress_callback("task-progress")
+    callback(1, 10, "first")
+    clock[0] += 10_000_000
+    callback(2, 10, "coalesced")
+    clock[0] += 10_000_000
+    callback(9, 10, "latest")
+    assert published == [(1, "first")]
+    assert [interval for interval, _ in timers] == [0.09]
+
+    # The task stalls here; the timer still publishes the throttled state.
+    clock[0] += 80_000_000
+    timers[0][1]()
+    assert published == [(1, "first"), (9, "latest")]
+
+    callback(10, 10, "final")
+    assert published[-1] == (10, "final")
+    assert logged == ["first", "coalesced", "latest", "final"]
+
+
+def test_native_task_runtime_notifies_data_changed_after_every_finished_task(monkeypatch) -> None:
+    from ai_actuarial import task_runtime
+    from ai_actuarial.task_runtime import NativeTaskRuntime
+
+    monkeypatch.setattr(task_runtime, "append_task_log", lambda *args, **kwargs: None)
+    monkeypatch.setattr(task_runtime, "append_job_history", lambda *args, **kwargs: None)
+    runtime = NativeTaskRuntime()
+    calls: list[str] = []
+    runtime.on_data_changed(lambda: calls.append("first"))
+    runtime.on_data_changed(lambda: (_ for _ in ()).throw(RuntimeError("boom")))
+    runtime.on_data_changed(lambda: calls.append("last"))
+
+    runtime.active_tasks["task-markdown"] = {"id": "task-markdown", "status": "running"}
+    runtime._finalize_task_success(
+        "task-markdown",
+        "markdown_conversion",
+        CollectionResult(success=True, items_found=2, items_downloaded=0, items_skipped=0, errors=[]),
+    )
+    runtime.active_tasks["task-failed"] = {"id": "task-failed", "status": "running"}
+    runtime._finalize_task_error("task-failed", "crawler crashed after writing rows")
+
+    assert calls == ["first", "last", "first", "last"]